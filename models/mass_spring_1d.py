@@ -52,6 +52,10 @@ class MassSpring1D:
         
         return self.kinetic_energy(state) + self.potential_energy(state)
 
+    def total_energy_batch(self, x, v):
+        
+        return 0.5 * self._mass * v * v + 0.5 * self._stiffness * x * x
+
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__name__}("
@@ -0,0 +1,38 @@
+
+
+try:
+    from numba import njit, prange
+    from numba.core.dispatcher import Dispatcher
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    Dispatcher = ()
+    prange = range
+
+    def njit(*args, **kwargs):
+        
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+KERNEL_MIN_STEPS = 100_000
+
+
+def is_jitted(fn) -> bool:
+    
+    return HAVE_NUMBA and isinstance(fn, Dispatcher)
+
+
+def use_kernel(fn, num_steps) -> bool:
+    
+    return is_jitted(fn) and num_steps >= KERNEL_MIN_STEPS
+
+
+def load_aot(name, fallback):
+    
+    try:
+        from physics_lab import _aot
+    except ImportError:
+        return fallback
+    return getattr(_aot, name, fallback)
@@ -0,0 +1,43 @@
+
+
+import os
+import sys
+
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from numba.pycc import CC
+
+from physics_lab.constraints.drift_analysis import _drift_stats_jit
+from physics_lab.constraints.pendulum import _pendulum_kernel_jit
+from physics_lab.core_math.matrices import _mat3_inv_jit
+from physics_lab.core_math.quaternions import _quat_mul_batch_jit
+from physics_lab.rigid_body.angular_stability import _euler_equations_step_jit
+
+
+EXPORTS = [
+    ('_pendulum_kernel', 'void(f8, f8, f8, f8[:], f8[:], f8[:])', _pendulum_kernel_jit),
+    ('_drift_stats', 'void(f8[:], f8[:])', _drift_stats_jit),
+    ('quat_mul_batch', 'f8[:, :](f8[:, :], f8[:, :], f8[:, :])', _quat_mul_batch_jit),
+    ('mat3_inv', 'f8(f8[:, :], f8[:, :])', _mat3_inv_jit),
+    ('_euler_equations_step', 'void(f8, f8, f8, f8, f8, f8, f8, i8, f8[:, :])',
+     _euler_equations_step_jit),
+]
+
+
+def build(output_dir: str = None):
+    
+    cc = CC('_aot')
+    cc.output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+    cc.verbose = True
+    
+    for name, signature, kernel in EXPORTS:
+        cc.export(name, signature)(kernel.py_func)
+    
+    cc.compile()
+    return cc.output_dir
+
+
+if __name__ == "__main__":
+    print(f"AOT module written to {build()}")
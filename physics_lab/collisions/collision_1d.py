@@ -1,8 +1,17 @@
 
 
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from physics_lab.core_math._fast import _fclose
+
 
 def elastic_collision_1d(m1: float, m2: float, v1: float, v2: float) -> tuple:
     
@@ -53,14 +62,14 @@ def validate_collision_laws():
     print(f"  Final velocities: v1'={v1_e:.2f} m/s, v2'={v2_e:.2f} m/s")
     print(f"  Momentum before: {p_before:.2f} kg⋅m/s")
     print(f"  Momentum after: {p_after:.2f} kg⋅m/s")
-    print(f"  Momentum conserved: {np.isclose(p_before, p_after)}")
+    print(f"  Momentum conserved: {_fclose(p_before, p_after)}")
     
     
     KE_before = 0.5 * m1 * v1**2 + 0.5 * m2 * v2**2
     KE_after = 0.5 * m1 * v1_e**2 + 0.5 * m2 * v2_e**2
     print(f"  KE before: {KE_before:.2f} J")
     print(f"  KE after: {KE_after:.2f} J")
-    print(f"  Energy conserved: {np.isclose(KE_before, KE_after)}\n")
+    print(f"  Energy conserved: {_fclose(KE_before, KE_after)}\n")
     
     
     v1_i, v2_i = inelastic_collision_1d(m1, m2, v1, v2, e=0.5)
@@ -69,14 +78,14 @@ def validate_collision_laws():
     KE_after_i = 0.5 * m1 * v1_i**2 + 0.5 * m2 * v2_i**2
     print(f"Inelastic Collision (e=0.5):")
     print(f"  Final velocities: v1'={v1_i:.2f} m/s, v2'={v2_i:.2f} m/s")
-    print(f"  Momentum conserved: {np.isclose(p_before, p_after_i)}")
+    print(f"  Momentum conserved: {_fclose(p_before, p_after_i)}")
     print(f"  Energy lost: {KE_before - KE_after_i:.2f} J ({(KE_before - KE_after_i)/KE_before*100:.1f}%)\n")
     
     
     v1_pi, v2_pi = inelastic_collision_1d(m1, m2, v1, v2, e=0.0)
     print(f"Perfectly Inelastic (e=0):")
     print(f"  Final velocities: v1'={v1_pi:.2f} m/s, v2'={v2_pi:.2f} m/s")
-    print(f"  Objects stick together: {np.isclose(v1_pi, v2_pi)}\n")
+    print(f"  Objects stick together: {_fclose(v1_pi, v2_pi)}\n")
 
 
 def plot_collision_restitution():
@@ -85,19 +94,12 @@ def plot_collision_restitution():
     v1, v2 = 3.0, 0.0
     
     e_values = np.linspace(0, 1, 50)
-    v1_finals = []
-    v2_finals = []
-    energy_retained = []
     
     KE_initial = 0.5 * m1 * v1**2 + 0.5 * m2 * v2**2
     
-    for e in e_values:
-        v1_f, v2_f = inelastic_collision_1d(m1, m2, v1, v2, e)
-        v1_finals.append(v1_f)
-        v2_finals.append(v2_f)
-        
-        KE_final = 0.5 * m1 * v1_f**2 + 0.5 * m2 * v2_f**2
-        energy_retained.append(KE_final / KE_initial)
+    v1_finals, v2_finals = inelastic_collision_1d(m1, m2, v1, v2, e_values)
+    KE_final = 0.5 * m1 * v1_finals**2 + 0.5 * m2 * v2_finals**2
+    energy_retained = KE_final / KE_initial
     
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
     
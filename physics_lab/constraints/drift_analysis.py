@@ -1,7 +1,33 @@
 
 
+import os
+import sys
+
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from physics_lab._jit import njit, load_aot
+
+
+@njit(cache=True)
+def _drift_stats_jit(errors, out):
+    
+    total = 0.0
+    peak = 0.0
+    for i in range(errors.shape[0]):
+        e = abs(errors[i])
+        total += e
+        if e > peak:
+            peak = e
+    out[0] = total / errors.shape[0]
+    out[1] = peak
+
+
+_drift_stats = load_aot('_drift_stats', _drift_stats_jit)
 
 
 def analyze_constraint_drift(errors: np.ndarray, times: np.ndarray, 
@@ -10,8 +36,9 @@ def analyze_constraint_drift(errors: np.ndarray, times: np.ndarray,
     print(f"=== {constraint_name} Drift Analysis ===\n")
     
     
-    mean_error = np.mean(np.abs(errors))
-    max_error = np.max(np.abs(errors))
+    stats_buf = np.empty(2)
+    _drift_stats(np.ascontiguousarray(errors, dtype=np.float64), stats_buf)
+    mean_error, max_error = float(stats_buf[0]), float(stats_buf[1])
     final_error = errors[-1]
     
     
@@ -23,8 +50,18 @@ def analyze_constraint_drift(errors: np.ndarray, times: np.ndarray,
     print(f"Final error: {final_error:.6e}")
     print(f"Drift rate: {drift_rate:.6e} per second\n")
     
+    stats = {
+        'mean_error': mean_error,
+        'max_error': max_error,
+        'drift_rate': drift_rate
+    }
+    
+    if os.environ.get('PLAB_NO_PLOT'):
+        return stats
+    dpi = 72 if os.environ.get('PLAB_FAST_PLOT') else 150
     
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
+    fig = Figure(figsize=(10, 8))
+    ax1, ax2 = fig.subplots(2, 1)
     
     ax1.plot(times, errors, 'b-', linewidth=2)
     ax1.set_xlabel('Time (s)')
@@ -39,15 +76,12 @@ def analyze_constraint_drift(errors: np.ndarray, times: np.ndarray,
     ax2.set_title('Absolute Error (Log Scale)')
     ax2.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig('constraint_drift.png', dpi=150)
+    fig.tight_layout()
+    fig.savefig('constraint_drift.png', dpi=dpi)
+    fig.clear()
     print(f"📊 Plot saved to constraint_drift.png")
     
-    return {
-        'mean_error': mean_error,
-        'max_error': max_error,
-        'drift_rate': drift_rate
-    }
+    return stats
 
 
 if __name__ == "__main__":
@@ -1,7 +1,16 @@
 
 
+import os
+import sys
+
 import numpy as np
 
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from physics_lab.core_math._fast import _norm
+
 
 class DistanceConstraint:
     
@@ -11,13 +20,13 @@ class DistanceConstraint:
     
     def error(self, p1: np.ndarray, p2: np.ndarray) -> float:
         
-        current_dist = np.linalg.norm(p2 - p1)
+        current_dist = _norm(p2 - p1)
         return current_dist - self.distance
     
     def gradient(self, p1: np.ndarray, p2: np.ndarray) -> tuple:
         
         diff = p2 - p1
-        dist = np.linalg.norm(diff)
+        dist = _norm(diff)
         if dist < 1e-10:
             return np.zeros_like(p1), np.zeros_like(p2)
         
@@ -33,12 +42,12 @@ class FixedPointConstraint:
     
     def error(self, p: np.ndarray) -> float:
         
-        return np.linalg.norm(p - self.fixed_position)
+        return _norm(p - self.fixed_position)
     
     def gradient(self, p: np.ndarray) -> np.ndarray:
         
         diff = p - self.fixed_position
-        dist = np.linalg.norm(diff)
+        dist = _norm(diff)
         if dist < 1e-10:
             return np.zeros_like(p)
         return diff / dist
@@ -61,7 +70,7 @@ def demonstrate_constraints():
     print(f"  Point 1: {p1}")
     print(f"  Point 2: {p2}")
     print(f"  Desired distance: {constraint_dist} m")
-    print(f"  Current distance: {np.linalg.norm(p2 - p1):.2f} m")
+    print(f"  Current distance: {_norm(p2 - p1):.2f} m")
     print(f"  Constraint error: {error:.4f} m")
     print(f"  Gradient at p1: {grad1}")
     print(f"  Gradient at p2: {grad2}\n")
@@ -1,50 +1,96 @@
 
 
+import math
+import os
+import sys
+
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 
-def simulate_simple_pendulum(length: float, theta0: float, omega0: float = 0.0,
-                             g: float = 9.81, dt: float = 0.01, duration: float = 10.0):
-    
-    num_steps = int(duration / dt)
-    
-    theta = theta0
-    omega = omega0
-    
-    thetas = [theta]
-    omegas = [omega]
-    energies = []
-    times = [0.0]
+from physics_lab._jit import njit, load_aot
+
+
+@njit(cache=True)
+def _pendulum_kernel_jit(length, g, dt, thetas, omegas, energies):
     
-    m = 1.0  
+    m = 1.0
+    theta = thetas[0]
+    omega = omegas[0]
     
-    for step in range(num_steps):
-        
-        alpha = -(g / length) * np.sin(theta)
+    for step in range(energies.shape[0]):
         
+        alpha = -(g / length) * math.sin(theta)
         
         omega += alpha * dt
         theta += omega * dt
         
-        thetas.append(theta)
-        omegas.append(omega)
-        times.append((step + 1) * dt)
-        
+        thetas[step + 1] = theta
+        omegas[step + 1] = omega
         
-        h = length * (1 - np.cos(theta))  
+        h = length * (1 - math.cos(theta))
         KE = 0.5 * m * (length * omega)**2
         PE = m * g * h
-        E_total = KE + PE
-        energies.append(E_total)
+        energies[step] = KE + PE
+
+
+_pendulum_kernel = load_aot('_pendulum_kernel', _pendulum_kernel_jit)
+
+
+def _small_angle_states(length, theta0, omega0, g, dt, num_steps):
+    
+    k = g / length
+    A = np.array([[1.0 - k * dt * dt, dt],
+                  [-k * dt, 1.0]])
+    d, V = np.linalg.eig(A)
+    if np.linalg.cond(V) > 1e8:
+        return None
+    
+    c = np.linalg.solve(V, np.array([theta0, omega0], dtype=complex))
+    powers = np.power(d[None, :], np.arange(num_steps + 1)[:, None])
+    states = ((powers * c[None, :]) @ V.T).real
+    return states[:, 0], states[:, 1]
+
+
+def simulate_simple_pendulum(length: float, theta0: float, omega0: float = 0.0,
+                             g: float = 9.81, dt: float = 0.01, duration: float = 10.0,
+                             small_angle_tol: float = 0.0):
     
-    return (np.array(times), np.array(thetas), np.array(omegas), 
-            np.array(energies))
+    num_steps = int(duration / dt)
+    times = np.arange(num_steps + 1) * dt
+    
+    amplitude = math.sqrt(theta0 * theta0 + omega0 * omega0 * length / g)
+    if amplitude < small_angle_tol:
+        states = _small_angle_states(length, theta0, omega0, g, dt, num_steps)
+        if states is not None:
+            thetas, omegas = states
+            m = 1.0
+            h = length * (1 - np.cos(thetas[1:]))
+            energies = 0.5 * m * (length * omegas[1:])**2 + m * g * h
+            return times, thetas, omegas, energies
+    
+    thetas = np.empty(num_steps + 1)
+    omegas = np.empty(num_steps + 1)
+    energies = np.empty(num_steps)
+    thetas[0] = theta0
+    omegas[0] = omega0
+    
+    _pendulum_kernel(float(length), float(g), float(dt), thetas, omegas, energies)
+    
+    return times, thetas, omegas, energies
 
 
 def plot_pendulum_results(times, thetas, omegas, energies):
     
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 10))
+    if os.environ.get('PLAB_NO_PLOT'):
+        return
+    dpi = 72 if os.environ.get('PLAB_FAST_PLOT') else 150
+    
+    fig = Figure(figsize=(12, 10))
+    (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
     
     
     ax1.plot(times, np.degrees(thetas), 'b-', linewidth=2)
@@ -77,8 +123,9 @@ def plot_pendulum_results(times, thetas, omegas, energies):
     ax4.set_title('Energy Conservation')
     ax4.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig('pendulum_constraint.png', dpi=150)
+    fig.tight_layout()
+    fig.savefig('pendulum_constraint.png', dpi=dpi)
+    fig.clear()
     print("📊 Plot saved to pendulum_constraint.png")
 
 
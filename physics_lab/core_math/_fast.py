@@ -0,0 +1,32 @@
+
+
+import math
+
+import numpy as np
+
+
+def _norm2(v) -> float:
+    
+    x, y = v[0], v[1]
+    return math.sqrt(x*x + y*y)
+
+
+def _norm3(v) -> float:
+    
+    x, y, z = v[0], v[1], v[2]
+    return math.sqrt(x*x + y*y + z*z)
+
+
+def _norm(v) -> float:
+    
+    n = len(v)
+    if n == 3:
+        return _norm3(v)
+    if n == 2:
+        return _norm2(v)
+    return math.sqrt(float(np.dot(v, v)))
+
+
+def _fclose(a: float, b: float, tol: float = 1e-9) -> bool:
+    
+    return abs(a - b) <= tol * max(1.0, abs(a), abs(b))
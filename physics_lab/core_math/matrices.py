@@ -1,8 +1,48 @@
 
 
+import os
+import sys
+
 import numpy as np
 from typing import List
 
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from physics_lab._jit import njit, load_aot
+from physics_lab.core_math._fast import _fclose
+
+
+@njit(cache=True)
+def _mat3_inv_jit(m, out):
+    
+    a, b, c = m[0, 0], m[0, 1], m[0, 2]
+    d, e, f = m[1, 0], m[1, 1], m[1, 2]
+    g, h, i = m[2, 0], m[2, 1], m[2, 2]
+    
+    A = e*i - f*h
+    B = f*g - d*i
+    C = d*h - e*g
+    det = a*A + b*B + c*C
+    if det == 0.0:
+        return 0.0
+    inv_det = 1.0 / det
+    
+    out[0, 0] = A * inv_det
+    out[0, 1] = (c*h - b*i) * inv_det
+    out[0, 2] = (b*f - c*e) * inv_det
+    out[1, 0] = B * inv_det
+    out[1, 1] = (a*i - c*g) * inv_det
+    out[1, 2] = (c*d - a*f) * inv_det
+    out[2, 0] = C * inv_det
+    out[2, 1] = (b*g - a*h) * inv_det
+    out[2, 2] = (a*e - b*d) * inv_det
+    return det
+
+
+mat3_inv = load_aot('mat3_inv', _mat3_inv_jit)
+
 
 class Mat3:
     
@@ -30,11 +70,19 @@ class Mat3:
         
         if isinstance(other, Mat3):
             return Mat3(self.data @ other.data)
-        elif isinstance(other, (list, np.ndarray)):
-            return self.data @ np.array(other)
+        elif isinstance(other, np.ndarray):
+            return self.data @ other
+        elif isinstance(other, list):
+            return self.data @ np.asarray(other)
         else:
             return Mat3(self.data * other)
     
+    def __matmul__(self, other):
+        
+        if isinstance(other, Mat3):
+            return Mat3(self.data @ other.data)
+        return self.data @ other
+    
     def transpose(self):
         
         return Mat3(self.data.T)
@@ -45,7 +93,10 @@ class Mat3:
     
     def inverse(self):
         
-        return Mat3(np.linalg.inv(self.data))
+        out = np.empty((3, 3))
+        if mat3_inv(self.data, out) == 0.0:
+            raise np.linalg.LinAlgError("Singular matrix")
+        return Mat3(out)
     
     def trace(self):
         
@@ -86,7 +137,7 @@ def validate_matrix_properties():
     det_At = At.determinant()
     print(f"det(A) = {det_A}")
     print(f"det(A^T) = {det_At}")
-    print(f"det(A) = det(A^T): {np.isclose(det_A, det_At)}\n")
+    print(f"det(A) = det(A^T): {_fclose(det_A, det_At)}\n")
     
     
     if abs(det_A) > 1e-10:
@@ -1,26 +1,42 @@
 
 
+import math
+import os
+import sys
+
 import numpy as np
 
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from physics_lab._jit import njit, prange, load_aot
+from physics_lab.core_math._fast import _norm3
+
 
 class Quaternion:
     
+    __slots__ = ('w', 'x', 'y', 'z', '_R', '_R_key')
     
     def __init__(self, w: float = 1.0, x: float = 0.0, y: float = 0.0, z: float = 0.0):
         self.w = w
         self.x = x
         self.y = y
         self.z = z
+        self._R = None
+        self._R_key = None
         self._normalize()
     
     def _normalize(self):
         
-        mag = np.sqrt(self.w**2 + self.x**2 + self.y**2 + self.z**2)
-        if mag > 1e-10:
-            self.w /= mag
-            self.x /= mag
-            self.y /= mag
-            self.z /= mag
+        w, x, y, z = self.w, self.x, self.y, self.z
+        # Branch-free: the zero quaternion maps to zero, but tiny non-zero inputs
+        # are scaled to unit length rather than left as is, so filter upstream.
+        inv = 1.0 / max(math.sqrt(w*w + x*x + y*y + z*z), 1e-300)
+        self.w = w * inv
+        self.x = x * inv
+        self.y = y * inv
+        self.z = z * inv
     
     def __repr__(self):
         return f"Quat({self.w:.3f}, {self.x:.3f}i, {self.y:.3f}j, {self.z:.3f}k)"
@@ -44,11 +60,11 @@ class Quaternion:
     @staticmethod
     def from_axis_angle(axis: np.ndarray, angle: float) -> 'Quaternion':
         
-        axis = axis / np.linalg.norm(axis)
+        axis = axis / _norm3(axis)
         half_angle = angle / 2
-        s = np.sin(half_angle)
+        s = math.sin(half_angle)
         return Quaternion(
-            np.cos(half_angle),
+            math.cos(half_angle),
             axis[0] * s,
             axis[1] * s,
             axis[2] * s
@@ -56,12 +72,23 @@ class Quaternion:
     
     def to_rotation_matrix(self) -> np.ndarray:
         
-        w, x, y, z = self.w, self.x, self.y, self.z
-        return np.array([
-            [1 - 2*y**2 - 2*z**2, 2*x*y - 2*w*z, 2*x*z + 2*w*y],
-            [2*x*y + 2*w*z, 1 - 2*x**2 - 2*z**2, 2*y*z - 2*w*x],
-            [2*x*z - 2*w*y, 2*y*z + 2*w*x, 1 - 2*x**2 - 2*y**2]
+        key = (self.w, self.x, self.y, self.z)
+        if self._R is not None and self._R_key == key:
+            return self._R
+        
+        w, x, y, z = key
+        xx, yy, zz = x * x, y * y, z * z
+        wx, wy, wz = w * x, w * y, w * z
+        xy, xz, yz = x * y, x * z, y * z
+        R = np.array([
+            [1 - 2*(yy + zz), 2*(xy - wz), 2*(xz + wy)],
+            [2*(xy + wz), 1 - 2*(xx + zz), 2*(yz - wx)],
+            [2*(xz - wy), 2*(yz + wx), 1 - 2*(xx + yy)]
         ])
+        R.setflags(write=False)
+        self._R = R
+        self._R_key = key
+        return R
     
     def rotate_vector(self, v: np.ndarray) -> np.ndarray:
         
@@ -70,6 +97,33 @@ class Quaternion:
         return np.array([result.x, result.y, result.z])
 
 
+@njit(parallel=True, fastmath=True, cache=True)
+def _quat_mul_batch_jit(A, B, out):
+    
+    for i in prange(A.shape[0]):
+        a0, a1, a2, a3 = A[i, 0], A[i, 1], A[i, 2], A[i, 3]
+        b0, b1, b2, b3 = B[i, 0], B[i, 1], B[i, 2], B[i, 3]
+        out[i, 0] = a0*b0 - a1*b1 - a2*b2 - a3*b3
+        out[i, 1] = a0*b1 + a1*b0 + a2*b3 - a3*b2
+        out[i, 2] = a0*b2 - a1*b3 + a2*b0 + a3*b1
+        out[i, 3] = a0*b3 + a1*b2 - a2*b1 + a3*b0
+    return out
+
+
+_quat_mul_batch = load_aot('quat_mul_batch', _quat_mul_batch_jit)
+
+
+def quat_mul_batch(Q1: np.ndarray, Q2: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    
+    Q1 = np.ascontiguousarray(Q1, dtype=np.float64)
+    Q2 = np.ascontiguousarray(Q2, dtype=np.float64)
+    if Q1.shape != Q2.shape or Q1.ndim != 2 or Q1.shape[1] != 4:
+        raise ValueError(f"Expected two (N, 4) arrays, got {Q1.shape} and {Q2.shape}")
+    if out is None:
+        out = np.empty_like(Q1)
+    return _quat_mul_batch(Q1, Q2, out)
+
+
 def validate_quaternion_properties():
     
     print("=== Quaternion Property Validation ===\n")
@@ -1,8 +1,23 @@
 
 
+import math
+import os
+import sys
+
 import numpy as np
 from typing import Union
 
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from physics_lab.core_math._fast import _fclose
+
 
 class Vec3:
     
@@ -30,6 +45,13 @@ class Vec3:
     def __truediv__(self, scalar: float) -> 'Vec3':
         return Vec3(self.x / scalar, self.y / scalar, self.z / scalar)
     
+    def add_into(self, other: 'Vec3') -> 'Vec3':
+        
+        self.x += other.x
+        self.y += other.y
+        self.z += other.z
+        return self
+    
     def dot(self, other: 'Vec3') -> float:
         
         return self.x * other.x + self.y * other.y + self.z * other.z
@@ -44,20 +66,109 @@ class Vec3:
     
     def magnitude(self) -> float:
         
-        return np.sqrt(self.x**2 + self.y**2 + self.z**2)
+        return math.sqrt(self.x*self.x + self.y*self.y + self.z*self.z)
     
     def normalized(self) -> 'Vec3':
         
-        mag = self.magnitude()
-        if mag < 1e-10:
-            return Vec3(0, 0, 0)
-        return self / mag
+        # Branch-free: the zero vector maps to zero, but tiny non-zero inputs
+        # are scaled to unit length rather than clamped, so filter upstream.
+        inv = 1.0 / max(self.magnitude(), 1e-300)
+        return Vec3(self.x * inv, self.y * inv, self.z * inv)
     
     def to_array(self) -> np.ndarray:
         
         return np.array([self.x, self.y, self.z])
 
 
+class Vec3Array:
+    
+    
+    def __init__(self, xs: np.ndarray, ys: np.ndarray, zs: np.ndarray):
+        self.xs = np.ascontiguousarray(xs, dtype=float)
+        self.ys = np.ascontiguousarray(ys, dtype=float)
+        self.zs = np.ascontiguousarray(zs, dtype=float)
+    
+    @staticmethod
+    def from_array(arr: np.ndarray) -> 'Vec3Array':
+        
+        arr = np.asarray(arr, dtype=float)
+        return Vec3Array(arr[:, 0], arr[:, 1], arr[:, 2])
+    
+    def __len__(self):
+        return len(self.xs)
+    
+    def __repr__(self):
+        return f"Vec3Array(n={len(self)})"
+    
+    def __iadd__(self, other: 'Vec3Array') -> 'Vec3Array':
+        np.add(self.xs, other.xs, out=self.xs)
+        np.add(self.ys, other.ys, out=self.ys)
+        np.add(self.zs, other.zs, out=self.zs)
+        return self
+    
+    def __isub__(self, other: 'Vec3Array') -> 'Vec3Array':
+        np.subtract(self.xs, other.xs, out=self.xs)
+        np.subtract(self.ys, other.ys, out=self.ys)
+        np.subtract(self.zs, other.zs, out=self.zs)
+        return self
+    
+    def __imul__(self, scalar) -> 'Vec3Array':
+        np.multiply(self.xs, scalar, out=self.xs)
+        np.multiply(self.ys, scalar, out=self.ys)
+        np.multiply(self.zs, scalar, out=self.zs)
+        return self
+    
+    def _locals(self, other: 'Vec3Array' = None) -> dict:
+        
+        local_dict = {'ax': self.xs, 'ay': self.ys, 'az': self.zs}
+        if other is not None:
+            local_dict.update({'bx': other.xs, 'by': other.ys, 'bz': other.zs})
+        return local_dict
+    
+    def cross(self, other: 'Vec3Array') -> 'Vec3Array':
+        
+        return Vec3Array(
+            self.ys * other.zs - self.zs * other.ys,
+            self.zs * other.xs - self.xs * other.zs,
+            self.xs * other.ys - self.ys * other.xs
+        )
+    
+    def cross_ne(self, other: 'Vec3Array') -> 'Vec3Array':
+        
+        if ne is None:
+            return self.cross(other)
+        
+        local_dict = self._locals(other)
+        return Vec3Array(
+            ne.evaluate("ay*bz - az*by", local_dict=local_dict),
+            ne.evaluate("az*bx - ax*bz", local_dict=local_dict),
+            ne.evaluate("ax*by - ay*bx", local_dict=local_dict)
+        )
+    
+    def magnitude(self) -> np.ndarray:
+        
+        return np.sqrt(self.xs * self.xs + self.ys * self.ys + self.zs * self.zs)
+    
+    def normalized(self) -> 'Vec3Array':
+        
+        if ne is None:
+            inv = 1.0 / np.maximum(self.magnitude(), 1e-300)
+            return Vec3Array(self.xs * inv, self.ys * inv, self.zs * inv)
+        
+        local_dict = self._locals()
+        local_dict['inv'] = ne.evaluate("1.0 / (sqrt(ax*ax + ay*ay + az*az) + 1e-300)",
+                                        local_dict=local_dict)
+        return Vec3Array(
+            ne.evaluate("ax*inv", local_dict=local_dict),
+            ne.evaluate("ay*inv", local_dict=local_dict),
+            ne.evaluate("az*inv", local_dict=local_dict)
+        )
+    
+    def to_array(self) -> np.ndarray:
+        
+        return np.column_stack((self.xs, self.ys, self.zs))
+
+
 def validate_vector_properties():
     
     print("=== Vector Property Validation ===\n")
@@ -88,7 +199,7 @@ def validate_vector_properties():
     dot2 = v2.dot(v1)
     print(f"v1 · v2 = {dot1}")
     print(f"v2 · v1 = {dot2}")
-    print(f"Dot symmetric: {np.isclose(dot1, dot2)}\n")
+    print(f"Dot symmetric: {_fclose(dot1, dot2)}\n")
     
     
     cross1 = v1.cross(v2)
@@ -106,7 +217,7 @@ def validate_vector_properties():
     v_norm = v1.normalized()
     print(f"v1 = {v1}, |v1| = {v1.magnitude()}")
     print(f"normalized v1 = {v_norm}, magnitude = {v_norm.magnitude()}")
-    print(f"Normalization correct: {np.isclose(v_norm.magnitude(), 1.0)}\n")
+    print(f"Normalization correct: {_fclose(v_norm.magnitude(), 1.0)}\n")
 
 
 if __name__ == "__main__":
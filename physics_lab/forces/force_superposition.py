@@ -1,9 +1,20 @@
 
 
+import math
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 from typing import List, Callable
 
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from physics_lab._jit import njit
+from physics_lab.core_math._fast import _norm
+
 
 class Force:
     
@@ -14,6 +25,16 @@ class Force:
     def compute(self, pos: np.ndarray, vel: np.ndarray, t: float) -> np.ndarray:
         
         raise NotImplementedError
+    
+    def compute_batch(self, pos: np.ndarray, vel: np.ndarray, t: np.ndarray) -> np.ndarray:
+        
+        return np.array([self.compute(p, v, ti) for p, v, ti in zip(pos, vel, t)])
+    
+    def add_to(self, F_total: np.ndarray, pos: np.ndarray, vel: np.ndarray, t: float) -> None:
+        
+        F = self.compute(pos, vel, t)
+        F_total[0] += F[0]
+        F_total[1] += F[1]
 
 
 class GravityForce(Force):
@@ -26,6 +47,12 @@ class GravityForce(Force):
     
     def compute(self, pos, vel, t):
         return np.array([0.0, -self.mass * self.g])
+    
+    def compute_batch(self, pos, vel, t):
+        return np.broadcast_to([0.0, -self.mass * self.g], (len(pos), 2))
+    
+    def add_to(self, F_total, pos, vel, t):
+        F_total[1] -= self.mass * self.g
 
 
 class DragForce(Force):
@@ -36,10 +63,23 @@ class DragForce(Force):
         self.drag_coeff = drag_coeff
     
     def compute(self, pos, vel, t):
-        v_mag = np.linalg.norm(vel)
+        v_mag = _norm(vel)
         if v_mag < 1e-10:
             return np.array([0.0, 0.0])
         return -self.drag_coeff * v_mag * vel
+    
+    def compute_batch(self, pos, vel, t):
+        v_mag = np.linalg.norm(vel, axis=1, keepdims=True)
+        v_mag[v_mag < 1e-10] = 0.0
+        return -self.drag_coeff * v_mag * vel
+    
+    def add_to(self, F_total, pos, vel, t):
+        v_mag = _norm(vel)
+        if v_mag < 1e-10:
+            return
+        scale = -self.drag_coeff * v_mag
+        F_total[0] += scale * vel[0]
+        F_total[1] += scale * vel[1]
 
 
 class SpringForce(Force):
@@ -53,6 +93,67 @@ class SpringForce(Force):
     def compute(self, pos, vel, t):
         displacement = pos - self.anchor
         return -self.k * displacement
+    
+    def compute_batch(self, pos, vel, t):
+        return -self.k * (pos - self.anchor)
+    
+    def add_to(self, F_total, pos, vel, t):
+        F_total[0] -= self.k * (pos[0] - self.anchor[0])
+        F_total[1] -= self.k * (pos[1] - self.anchor[1])
+
+
+def build_accel(mass: float, forces: List[Force]):
+    
+    weight = 0.0
+    drag_coeff = 0.0
+    k = 0.0
+    k_anchor_x = 0.0
+    k_anchor_y = 0.0
+    
+    for force in forces:
+        kind = type(force)
+        if kind is GravityForce:
+            weight += force.mass * force.g
+        elif kind is DragForce:
+            drag_coeff += force.drag_coeff
+        elif kind is SpringForce:
+            k += force.k
+            k_anchor_x += force.k * force.anchor[0]
+            k_anchor_y += force.k * force.anchor[1]
+        else:
+            return None
+    
+    return (1.0 / mass, weight, drag_coeff, k, k_anchor_x, k_anchor_y)
+
+
+@njit(cache=True)
+def _fused_accel(px, py, vx, vy, inv_mass, weight, drag_coeff, k, k_anchor_x, k_anchor_y):
+    
+    fx = k_anchor_x - k * px
+    fy = k_anchor_y - k * py - weight
+    v = math.sqrt(vx*vx + vy*vy)
+    if v >= 1e-10:
+        fx -= drag_coeff * v * vx
+        fy -= drag_coeff * v * vy
+    return fx * inv_mass, fy * inv_mass
+
+
+@njit(cache=True)
+def _multi_force_step(params, dt, num_steps, pos_out, vel_out):
+    
+    inv_mass, weight, drag_coeff, k, k_anchor_x, k_anchor_y = params
+    px, py = pos_out[0, 0], pos_out[0, 1]
+    vx, vy = vel_out[0, 0], vel_out[0, 1]
+    
+    for i in range(num_steps):
+        ax, ay = _fused_accel(px, py, vx, vy, inv_mass, weight,
+                              drag_coeff, k, k_anchor_x, k_anchor_y)
+        vx += ax * dt
+        vy += ay * dt
+        px += vx * dt
+        py += vy * dt
+        pos_out[i + 1, 0], pos_out[i + 1, 1] = px, py
+        vel_out[i + 1, 0], vel_out[i + 1, 1] = vx, vy
 
 
 def simulate_multi_force(mass: float, pos0: np.ndarray, vel0: np.ndarray,
@@ -60,35 +161,43 @@ def simulate_multi_force(mass: float, pos0: np.ndarray, vel0: np.ndarray,
     
     num_steps = int(duration / dt)
     
-    pos = pos0.copy()
-    vel = vel0.copy()
-    
-    positions = [pos.copy()]
-    velocities = [vel.copy()]
-    force_histories = {f.name: [] for f in forces}
-    times = [0.0]
-    
-    for step in range(num_steps):
-        t = step * dt
-        
-        
+    positions = np.empty((num_steps + 1, 2))
+    velocities = np.empty((num_steps + 1, 2))
+    positions[0] = pos0
+    velocities[0] = vel0
+    times = np.arange(num_steps + 1) * dt
+    
+    params = build_accel(mass, forces)
+    if params is not None:
+        _multi_force_step(params, float(dt), num_steps, positions, velocities)
+    else:
+        px, py = positions[0]
+        vx, vy = velocities[0]
         F_total = np.zeros(2)
-        for force in forces:
-            F = force.compute(pos, vel, t)
-            F_total += F
-            force_histories[force.name].append(F.copy())
-        
-        
-        acc = F_total / mass
-        vel += acc * dt
-        pos += vel * dt
-        
-        positions.append(pos.copy())
-        velocities.append(vel.copy())
-        times.append(t + dt)
-    
-    return (np.array(positions), np.array(velocities), 
-            np.array(times), force_histories)
+        for step in range(num_steps):
+            t = step * dt
+            
+            
+            F_total[0] = 0.0
+            F_total[1] = 0.0
+            for force in forces:
+                force.add_to(F_total, positions[step], velocities[step], t)
+            
+            
+            vx += F_total[0] / mass * dt
+            vy += F_total[1] / mass * dt
+            px += vx * dt
+            py += vy * dt
+            
+            positions[step + 1, 0], positions[step + 1, 1] = px, py
+            velocities[step + 1, 0], velocities[step + 1, 1] = vx, vy
+    
+    force_histories = {
+        f.name: f.compute_batch(positions[:-1], velocities[:-1], times[:-1])
+        for f in forces
+    }
+    
+    return positions, velocities, times, force_histories
 
 
 def plot_multi_force_results(positions, times, force_histories):
@@ -108,7 +217,7 @@ def plot_multi_force_results(positions, times, force_histories):
     
     
     for force_name, force_history in force_histories.items():
-        force_mags = [np.linalg.norm(f) for f in force_history]
+        force_mags = np.linalg.norm(force_history, axis=1)
         ax2.plot(times[:-1], force_mags, label=force_name, linewidth=2)
     
     ax2.set_xlabel('Time (s)')
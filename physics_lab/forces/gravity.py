@@ -1,15 +1,26 @@
 
 
+import math
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from physics_lab._jit import njit
+from physics_lab.core_math._fast import _norm
+
 
 G = 6.67430e-11  
 
 
 def gravitational_force(m1: float, m2: float, r_vec: np.ndarray) -> np.ndarray:
     
-    r_mag = np.linalg.norm(r_vec)
+    r_mag = _norm(r_vec)
     if r_mag < 1e-10:
         return np.zeros_like(r_vec)
     
@@ -19,51 +30,79 @@ def gravitational_force(m1: float, m2: float, r_vec: np.ndarray) -> np.ndarray:
     return F_vec
 
 
+@njit(cache=True, fastmath=True)
+def _two_body_step(m1, m2, G, r0, v0, dt, num_steps,
+                   pos1_out, pos2_out, vel1_out, vel2_out):
+    
+    r1x, r1y = 0.0, 0.0
+    r2x, r2y = r0[0], r0[1]
+    v1x, v1y = 0.0, 0.0
+    v2x, v2y = v0[0], v0[1]
+    
+    pos1_out[0, 0], pos1_out[0, 1] = r1x, r1y
+    pos2_out[0, 0], pos2_out[0, 1] = r2x, r2y
+    
+    Gm1m2 = G * m1 * m2
+    inv_m1 = 1.0 / m1
+    inv_m2 = 1.0 / m2
+    
+    for i in range(num_steps):
+        dx = r2x - r1x
+        dy = r2y - r1y
+        r2sq = dx*dx + dy*dy
+        if r2sq < 1e-20:
+            fx, fy = 0.0, 0.0
+        else:
+            scale = Gm1m2 / (r2sq * math.sqrt(r2sq))
+            fx, fy = scale * dx, scale * dy
+        
+        v1x += fx * inv_m1 * dt
+        v1y += fy * inv_m1 * dt
+        v2x -= fx * inv_m2 * dt
+        v2y -= fy * inv_m2 * dt
+        
+        r1x += v1x * dt
+        r1y += v1y * dt
+        r2x += v2x * dt
+        r2y += v2y * dt
+        
+        pos1_out[i + 1, 0], pos1_out[i + 1, 1] = r1x, r1y
+        pos2_out[i + 1, 0], pos2_out[i + 1, 1] = r2x, r2y
+        vel1_out[i, 0], vel1_out[i, 1] = v1x, v1y
+        vel2_out[i, 0], vel2_out[i, 1] = v2x, v2y
+
+
 def simulate_two_body_orbit(m1: float, m2: float, r0: np.ndarray, v0: np.ndarray,
                             dt: float = 1000, num_steps: int = 10000):
     
+    positions_1 = np.empty((num_steps + 1, 2))
+    positions_2 = np.empty((num_steps + 1, 2))
+    velocities_1 = np.empty((num_steps, 2))
+    velocities_2 = np.empty((num_steps, 2))
     
-    r1 = np.array([0.0, 0.0])  
-    r2 = r0.copy()
-    v1 = np.array([0.0, 0.0])
-    v2 = v0.copy()
+    _two_body_step(float(m1), float(m2), G,
+                   np.asarray(r0, dtype=np.float64), np.asarray(v0, dtype=np.float64),
+                   float(dt), num_steps,
+                   positions_1, positions_2, velocities_1, velocities_2)
     
     
-    positions_1 = [r1.copy()]
-    positions_2 = [r2.copy()]
-    energies = []
-    times = []
+    times = np.arange(num_steps) * dt
+    energies = np.empty(num_steps)
+    scratch = np.empty(num_steps)
     
-    for step in range(num_steps):
-        
-        r_vec = r2 - r1
-        F = gravitational_force(m1, m2, r_vec)
-        
-        
-        a1 = F / m1
-        a2 = -F / m2
-        
-        v1 += a1 * dt
-        v2 += a2 * dt
-        
-        
-        r1 += v1 * dt
-        r2 += v2 * dt
-        
-        
-        positions_1.append(r1.copy())
-        positions_2.append(r2.copy())
-        times.append(step * dt)
-        
-        
-        r_mag = np.linalg.norm(r2 - r1)
-        KE = 0.5 * m1 * np.linalg.norm(v1)**2 + 0.5 * m2 * np.linalg.norm(v2)**2
-        PE = -G * m1 * m2 / r_mag if r_mag > 0 else 0
-        E_total = KE + PE
-        energies.append(E_total)
-    
-    return (np.array(positions_1), np.array(positions_2), 
-            np.array(times), np.array(energies))
+    np.einsum('ij,ij->i', velocities_1, velocities_1, out=energies)
+    energies *= 0.5 * m1
+    np.einsum('ij,ij->i', velocities_2, velocities_2, out=scratch)
+    scratch *= 0.5 * m2
+    energies += scratch
+    
+    dr = positions_2[1:] - positions_1[1:]
+    np.einsum('ij,ij->i', dr, dr, out=scratch)
+    np.sqrt(scratch, out=scratch)
+    np.divide(-G * m1 * m2, scratch, out=scratch, where=scratch > 0)
+    energies += scratch
+    
+    return positions_1, positions_2, times, energies
 
 
 def plot_orbit_results(pos1, pos2, times, energies):
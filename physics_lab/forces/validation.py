@@ -6,14 +6,14 @@ import numpy as np
 def validate_newton_third_law(F1_on_2: np.ndarray, F2_on_1: np.ndarray, 
                               tolerance: float = 1e-6) -> bool:
     
-    return np.allclose(F1_on_2, -F2_on_1, atol=tolerance)
+    return bool(np.max(np.abs(F1_on_2 + F2_on_1)) <= tolerance)
 
 
 def validate_force_units(force: np.ndarray, mass: float, acceleration: np.ndarray,
                         tolerance: float = 1e-6) -> bool:
     
     expected_force = mass * acceleration
-    return np.allclose(force, expected_force, atol=tolerance)
+    return bool(np.max(np.abs(force - expected_force)) <= tolerance)
 
 
 def check_energy_conservation(KE: np.ndarray, PE: np.ndarray,
@@ -25,7 +25,9 @@ def check_energy_conservation(KE: np.ndarray, PE: np.ndarray,
     if abs(initial_energy) < 1e-10:
         return True, 0.0
     
-    drift = np.max(np.abs(total_energy - initial_energy)) / abs(initial_energy) * 100
+    deviation = total_energy - initial_energy
+    np.abs(deviation, out=deviation)
+    drift = deviation.max() / abs(initial_energy) * 100
     is_conserved = drift < max_drift_percent
     
     return is_conserved, drift
@@ -34,7 +36,7 @@ def check_energy_conservation(KE: np.ndarray, PE: np.ndarray,
 def validate_momentum_conservation(p_initial: np.ndarray, p_final: np.ndarray,
                                    tolerance: float = 1e-6) -> bool:
     
-    return np.allclose(p_initial, p_final, atol=tolerance)
+    return bool(np.max(np.abs(p_initial - p_final)) <= tolerance)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,135 @@
+
+
+import os
+import sys
+
+import numpy as np
+
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from physics_lab._jit import njit
+
+
+@njit(cache=True, fastmath=True)
+def _euler_step(f, t, y, dt, num_steps, args):
+    
+    d = y.shape[1]
+    for i in range(num_steps):
+        dy = f(t[i], y[i], *args)
+        for j in range(d):
+            y[i + 1, j] = y[i, j] + dt * dy[j]
+
+
+@njit(cache=True, fastmath=True)
+def _rk4_step(f, t, y, dt, num_steps, args):
+    
+    d = y.shape[1]
+    half_dt = 0.5 * dt
+    sixth_dt = dt / 6.0
+    y_stage = np.empty(d)
+    
+    for i in range(num_steps):
+        ti = t[i]
+        yi = y[i]
+        
+        k1 = f(ti, yi, *args)
+        for j in range(d):
+            y_stage[j] = yi[j] + half_dt * k1[j]
+        k2 = f(ti + half_dt, y_stage, *args)
+        for j in range(d):
+            y_stage[j] = yi[j] + half_dt * k2[j]
+        k3 = f(ti + half_dt, y_stage, *args)
+        for j in range(d):
+            y_stage[j] = yi[j] + dt * k3[j]
+        k4 = f(ti + dt, y_stage, *args)
+        
+        for j in range(d):
+            y[i + 1, j] = yi[j] + sixth_dt * (k1[j] + 2.0 * k2[j] + 2.0 * k3[j] + k4[j])
+
+
+@njit(cache=True, fastmath=True)
+def _semi_implicit_step(f, t, y, dt, num_steps, args):
+    
+    for i in range(num_steps):
+        deriv = f(t[i], y[i], *args)
+        v_new = y[i, 1] + dt * deriv[1]
+        y[i + 1, 1] = v_new
+        y[i + 1, 0] = y[i, 0] + dt * v_new
+
+
+@njit(cache=True, fastmath=True)
+def _verlet_step(accel_func, x, v, dt, num_steps, args):
+    
+    half_dt = 0.5 * dt
+    half_dt2 = 0.5 * dt * dt
+    a_current = accel_func(x[0], *args)
+    
+    for i in range(num_steps):
+        x[i + 1] = x[i] + v[i] * dt + half_dt2 * a_current
+        a_next = accel_func(x[i + 1], *args)
+        v[i + 1] = v[i] + half_dt * (a_current + a_next)
+        a_current = a_next
+
+
+@njit(cache=True, fastmath=True)
+def _verlet_ode_step(f, t, y, dt, num_steps, args):
+    
+    half_dt = 0.5 * dt
+    half_dt2 = 0.5 * dt * dt
+    stage = np.empty(2)
+    a_current = f(t[0], y[0], *args)[1]
+    
+    for i in range(num_steps):
+        y[i + 1, 0] = y[i, 0] + y[i, 1] * dt + half_dt2 * a_current
+        stage[0] = y[i + 1, 0]
+        stage[1] = y[i, 1] + half_dt * a_current
+        a_next = f(t[i + 1], stage, *args)[1]
+        y[i + 1, 1] = y[i, 1] + half_dt * (a_current + a_next)
+        a_current = a_next
+
+
+@njit(cache=True, fastmath=True)
+def _euler_scalar_step(accel_fn, x, v, dt, num_steps, args):
+    
+    x_i, v_i = x[0], v[0]
+    for i in range(num_steps):
+        a = accel_fn(x_i, *args)
+        x_i, v_i = x_i + dt * v_i, v_i + dt * a
+        x[i + 1] = x_i
+        v[i + 1] = v_i
+
+
+@njit(cache=True, fastmath=True)
+def _semi_implicit_scalar_step(accel_fn, x, v, dt, num_steps, args):
+    
+    x_i, v_i = x[0], v[0]
+    for i in range(num_steps):
+        v_i += dt * accel_fn(x_i, *args)
+        x_i += dt * v_i
+        x[i + 1] = x_i
+        v[i + 1] = v_i
+
+
+@njit(cache=True, fastmath=True)
+def _rk4_scalar_step(accel_fn, x, v, dt, num_steps, args):
+    
+    half_dt = 0.5 * dt
+    sixth_dt = dt / 6.0
+    x_i, v_i = x[0], v[0]
+    
+    for i in range(num_steps):
+        k1x = v_i
+        k1v = accel_fn(x_i, *args)
+        k2x = v_i + half_dt * k1v
+        k2v = accel_fn(x_i + half_dt * k1x, *args)
+        k3x = v_i + half_dt * k2v
+        k3v = accel_fn(x_i + half_dt * k2x, *args)
+        k4x = v_i + dt * k3v
+        k4v = accel_fn(x_i + dt * k3x, *args)
+        
+        x_i += sixth_dt * (k1x + 2.0 * k2x + 2.0 * k3x + k4x)
+        v_i += sixth_dt * (k1v + 2.0 * k2v + 2.0 * k3v + k4v)
+        x[i + 1] = x_i
+        v[i + 1] = v_i
@@ -4,6 +4,20 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 
+def _linear_trajectory(M: np.ndarray, s0: np.ndarray, num_steps: int) -> np.ndarray:
+    
+    states = np.empty((num_steps, len(s0)))
+    states[0] = s0
+    filled = 1
+    P = M
+    while filled < num_steps:
+        block = min(filled, num_steps - filled)
+        states[filled:filled + block] = states[:block] @ P.T
+        filled += block
+        P = P @ P
+    return states
+
+
 def analyze_integrator_energy_drift():
     
     print("=== Integrator Energy Drift Comparison ===\n")
@@ -15,44 +29,30 @@ def analyze_integrator_energy_drift():
     dt = 0.1
     
     
+    num_steps = int(t_end / dt)
+    w2 = omega**2
+    s0 = np.array([x0, v0])
+    
+    def energy(states):
+        return 0.5 * states[:, 1]**2 + 0.5 * w2 * states[:, 0]**2
+    
+    
     def forward_euler():
-        num_steps = int(t_end / dt)
-        x, v = x0, v0
-        energies = []
-        for _ in range(num_steps):
-            energies.append(0.5 * v**2 + 0.5 * omega**2 * x**2)
-            a = -omega**2 * x
-            x_new = x + v * dt
-            v_new = v + a * dt
-            x, v = x_new, v_new
-        return np.array(energies)
+        M = np.array([[1.0, dt],
+                      [-w2 * dt, 1.0]])
+        return energy(_linear_trajectory(M, s0, num_steps))
     
     
     def semi_implicit_euler():
-        num_steps = int(t_end / dt)
-        x, v = x0, v0
-        energies = []
-        for _ in range(num_steps):
-            energies.append(0.5 * v**2 + 0.5 * omega**2 * x**2)
-            a = -omega**2 * x
-            v_new = v + a * dt
-            x_new = x + v_new * dt
-            x, v = x_new, v_new
-        return np.array(energies)
+        M = np.array([[1.0 - w2 * dt**2, dt],
+                      [-w2 * dt, 1.0]])
+        return energy(_linear_trajectory(M, s0, num_steps))
     
     
     def verlet():
-        num_steps = int(t_end / dt)
-        x, v = x0, v0
-        a = -omega**2 * x
-        energies = []
-        for _ in range(num_steps):
-            energies.append(0.5 * v**2 + 0.5 * omega**2 * x**2)
-            x_new = x + v * dt + 0.5 * a * dt**2
-            a_new = -omega**2 * x_new
-            v_new = v + 0.5 * (a + a_new) * dt
-            x, v, a = x_new, v_new, a_new
-        return np.array(energies)
+        M = np.array([[1.0 - 0.5 * w2 * dt**2, dt],
+                      [-w2 * dt + 0.25 * w2**2 * dt**3, 1.0 - 0.5 * w2 * dt**2]])
+        return energy(_linear_trajectory(M, s0, num_steps))
     
     
     E_forward = forward_euler()
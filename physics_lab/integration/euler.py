@@ -1,27 +1,60 @@
 
 
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from physics_lab._jit import use_kernel
+from physics_lab.integration._numba_kernels import _euler_step, _euler_scalar_step
+
 
-def forward_euler(f, y0, t_span, dt):
+def forward_euler(f, y0, t_span, dt, args=()):
     
     t_start, t_end = t_span
     num_steps = int((t_end - t_start) / dt)
     
-    t = np.zeros(num_steps + 1)
-    y = np.zeros((num_steps + 1, len(y0)))
+    t = t_start + np.arange(num_steps + 1) * dt
+    y = np.empty((num_steps + 1, len(y0)))
     
-    t[0] = t_start
     y[0] = y0
     
+    if use_kernel(f, num_steps):
+        _euler_step(f, t, y, dt, num_steps, tuple(args))
+        return t, y
+    f = getattr(f, 'py_func', f)
+    
     for i in range(num_steps):
-        y[i + 1] = y[i] + dt * f(t[i], y[i])
-        t[i + 1] = t[0] + (i + 1) * dt
+        y[i + 1] = y[i] + dt * f(t[i], y[i], *args)
     
     return t, y
 
 
+def forward_euler_scalar(accel_fn, x0, v0, t_span, dt, args=()):
+    
+    t_start, t_end = t_span
+    num_steps = int((t_end - t_start) / dt)
+    
+    t = t_start + np.arange(num_steps + 1) * dt
+    x = np.empty(num_steps + 1)
+    v = np.empty(num_steps + 1)
+    x[0], v[0] = x0, v0
+    
+    if use_kernel(accel_fn, num_steps):
+        kernel = _euler_scalar_step
+    else:
+        kernel = getattr(_euler_scalar_step, 'py_func', _euler_scalar_step)
+        accel_fn = getattr(accel_fn, 'py_func', accel_fn)
+    kernel(accel_fn, x, v, dt, num_steps, tuple(args))
+    
+    return t, x, v
+
+
 def harmonic_oscillator_ode(t, y, omega=1.0):
     
     x, v = y
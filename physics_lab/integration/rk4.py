@@ -1,30 +1,106 @@
 
 
+import os
+import sys
+
 import numpy as np
 
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from physics_lab._jit import use_kernel
+from physics_lab.integration._numba_kernels import _rk4_step, _rk4_scalar_step
+
 
-def rk4(f, y0, t_span, dt):
+def rk4(f, y0, t_span, dt, args=()):
     
     t_start, t_end = t_span
     num_steps = int((t_end - t_start) / dt)
 
-    t = np.zeros(num_steps + 1)
-    y = np.zeros((num_steps + 1, len(y0)))
+    t = t_start + np.arange(num_steps + 1) * dt
+    y = np.empty((num_steps + 1, len(y0)))
 
-    t[0] = t_start
     y[0] = y0
 
+    if use_kernel(f, num_steps):
+        _rk4_step(f, t, y, dt, num_steps, tuple(args))
+        return t, y
+    f = getattr(f, 'py_func', f)
+
+    k = np.empty((4, len(y0)))
+    stage = np.empty(len(y0))
+    half_dt = 0.5 * dt
+    sixth_dt = dt / 6.0
+
     for i in range(num_steps):
         ti = t[i]
         yi = y[i]
+        y_next = y[i + 1]
 
         
-        k1 = np.asarray(f(ti,            yi),            dtype=float)
-        k2 = np.asarray(f(ti + 0.5 * dt, yi + 0.5 * dt * k1), dtype=float)
-        k3 = np.asarray(f(ti + 0.5 * dt, yi + 0.5 * dt * k2), dtype=float)
-        k4 = np.asarray(f(ti + dt,       yi + dt * k3),        dtype=float)
+        k[0] = f(ti, yi, *args)
+        np.multiply(k[0], half_dt, out=stage)
+        stage += yi
+        k[1] = f(ti + half_dt, stage, *args)
+        np.multiply(k[1], half_dt, out=stage)
+        stage += yi
+        k[2] = f(ti + half_dt, stage, *args)
+        np.multiply(k[2], dt, out=stage)
+        stage += yi
+        k[3] = f(ti + dt, stage, *args)
+
+        np.multiply(k[1], 2.0, out=stage)
+        stage += k[0]
+        np.multiply(k[2], 2.0, out=y_next)
+        stage += y_next
+        stage += k[3]
+        np.multiply(stage, sixth_dt, out=y_next)
+        y_next += yi
+
+    return t, y
+
+def rk4_linear(J, y0, t_span, dt):
+    
+    J = np.asarray(J, dtype=float)
+    t_start, t_end = t_span
+    num_steps = int((t_end - t_start) / dt)
+    d = len(y0)
+    if J.shape != (d, d):
+        raise ValueError(f"J must have shape ({d}, {d}), got {J.shape}")
+
+    I = np.eye(d)
+    k1 = J
+    k2 = J @ (I + 0.5 * dt * k1)
+    k3 = J @ (I + 0.5 * dt * k2)
+    k4 = J @ (I + dt * k3)
+    A = I + (dt / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4)
+
+    t = t_start + np.arange(num_steps + 1) * dt
+    y = np.empty((num_steps + 1, d))
+    y[0] = y0
+
+    for i in range(num_steps):
+        np.matmul(A, y[i], out=y[i + 1])
+
+    return t, y
+
+
+def rk4_scalar(accel_fn, x0, v0, t_span, dt, args=()):
+
+    t_start, t_end = t_span
+    num_steps = int((t_end - t_start) / dt)
+
+    t = t_start + np.arange(num_steps + 1) * dt
+    x = np.empty(num_steps + 1)
+    v = np.empty(num_steps + 1)
+    x[0], v[0] = x0, v0
 
-        y[i + 1] = yi + (dt / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4)
-        t[i + 1] = t_start + (i + 1) * dt
+    if use_kernel(accel_fn, num_steps):
+        kernel = _rk4_scalar_step
+    else:
+        kernel = getattr(_rk4_scalar_step, 'py_func', _rk4_scalar_step)
+        accel_fn = getattr(accel_fn, 'py_func', accel_fn)
+    kernel(accel_fn, x, v, dt, num_steps, tuple(args))
 
-    return t, y
\ No newline at end of file
+    return t, x, v
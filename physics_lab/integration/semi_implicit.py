@@ -1,32 +1,66 @@
 
 
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from physics_lab._jit import use_kernel
+from physics_lab.integration._numba_kernels import _semi_implicit_step, _semi_implicit_scalar_step
+from physics_lab.integration.euler import harmonic_oscillator_ode
 
-def semi_implicit_euler(f, y0, t_span, dt):
+
+def semi_implicit_euler(f, y0, t_span, dt, args=()):
     
     t_start, t_end = t_span
     num_steps = int((t_end - t_start) / dt)
     
-    t = np.zeros(num_steps + 1)
-    y = np.zeros((num_steps + 1, len(y0)))
+    t = t_start + np.arange(num_steps + 1) * dt
+    y = np.empty((num_steps + 1, len(y0)))
     
-    t[0] = t_start
     y[0] = y0
     
+    if use_kernel(f, num_steps):
+        _semi_implicit_step(f, t, y, dt, num_steps, tuple(args))
+        return t, y
+    f = getattr(f, 'py_func', f)
+    
     for i in range(num_steps):
         
-        deriv = f(t[i], y[i])
+        deriv = f(t[i], y[i], *args)
         v_new = y[i, 1] + dt * deriv[1]  
-        x_new = y[i, 0] + dt * v_new      
         
-        y[i + 1] = np.array([x_new, v_new])
-        t[i + 1] = t[0] + (i + 1) * dt
+        y[i + 1, 1] = v_new
+        y[i + 1, 0] = y[i, 0] + dt * v_new
     
     return t, y
 
 
+def semi_implicit_euler_scalar(accel_fn, x0, v0, t_span, dt, args=()):
+    
+    t_start, t_end = t_span
+    num_steps = int((t_end - t_start) / dt)
+    
+    t = t_start + np.arange(num_steps + 1) * dt
+    x = np.empty(num_steps + 1)
+    v = np.empty(num_steps + 1)
+    x[0], v[0] = x0, v0
+    
+    if use_kernel(accel_fn, num_steps):
+        kernel = _semi_implicit_scalar_step
+    else:
+        kernel = getattr(_semi_implicit_scalar_step, 'py_func', _semi_implicit_scalar_step)
+        accel_fn = getattr(accel_fn, 'py_func', accel_fn)
+    kernel(accel_fn, x, v, dt, num_steps, tuple(args))
+    
+    return t, x, v
+
+
 def compare_euler_methods():
     
     print("=== Euler Method Comparison ===\n")
@@ -37,9 +71,7 @@ def compare_euler_methods():
     t_span = (0, 50)
     dt = 0.1
     
-    def harmonic_ode(t, y):
-        x, v = y
-        return np.array([v, -omega**2 * x])
+    harmonic_ode = harmonic_oscillator_ode
     
     
     t, y_semi = semi_implicit_euler(harmonic_ode, y0, t_span, dt)
@@ -48,12 +80,11 @@ def compare_euler_methods():
     def forward_euler(f, y0, t_span, dt):
         t_start, t_end = t_span
         num_steps = int((t_end - t_start) / dt)
-        t = np.zeros(num_steps + 1)
-        y = np.zeros((num_steps + 1, len(y0)))
-        t[0], y[0] = t_start, y0
+        t = t_start + np.arange(num_steps + 1) * dt
+        y = np.empty((num_steps + 1, len(y0)))
+        y[0] = y0
         for i in range(num_steps):
             y[i + 1] = y[i] + dt * f(t[i], y[i])
-            t[i + 1] = t[0] + (i + 1) * dt
         return t, y
     
     t, y_forward = forward_euler(harmonic_ode, y0, t_span, dt)
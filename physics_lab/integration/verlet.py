@@ -1,38 +1,96 @@
 
 
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from physics_lab._jit import use_kernel
+from physics_lab.integration._numba_kernels import _verlet_ode_step, _verlet_step
+
 
-def velocity_verlet(accel_func, x0, v0, t_span, dt):
+def velocity_verlet(accel_func, x0, v0, t_span, dt, args=()):
     
     t_start, t_end = t_span
     num_steps = int((t_end - t_start) / dt)
     
-    t = np.zeros(num_steps + 1)
-    x = np.zeros(num_steps + 1)
-    v = np.zeros(num_steps + 1)
+    t = t_start + np.arange(num_steps + 1) * dt
+    x = np.empty(num_steps + 1)
+    v = np.empty(num_steps + 1)
+    
+    x[0], v[0] = x0, v0
+    
+    if use_kernel(accel_func, num_steps):
+        _verlet_step(accel_func, x, v, dt, num_steps, tuple(args))
+        return t, x, v
+    accel_func = getattr(accel_func, 'py_func', accel_func)
     
-    t[0], x[0], v[0] = t_start, x0, v0
-    a_current = accel_func(x[0])
+    half_dt = 0.5 * dt
+    half_dt2 = 0.5 * dt * dt
+    x_i, v_i = x[0], v[0]
+    a_current = accel_func(x_i, *args)
     
     for i in range(num_steps):
         
-        x[i + 1] = x[i] + v[i] * dt + 0.5 * a_current * dt**2
+        x_next = x_i + v_i * dt + half_dt2 * a_current
         
         
-        a_next = accel_func(x[i + 1])
+        a_next = accel_func(x_next, *args)
         
         
-        v[i + 1] = v[i] + 0.5 * (a_current + a_next) * dt
+        v_i = v_i + half_dt * (a_current + a_next)
+        x_i = x_next
+        x[i + 1] = x_i
+        v[i + 1] = v_i
         
         
         a_current = a_next
-        t[i + 1] = t[0] + (i + 1) * dt
     
     return t, x, v
 
 
+def velocity_verlet_ode(f, y0, t_span, dt, args=()):
+    
+    t_start, t_end = t_span
+    num_steps = int((t_end - t_start) / dt)
+    
+    t = t_start + np.arange(num_steps + 1) * dt
+    y = np.empty((num_steps + 1, 2))
+    y[0] = y0
+    
+    if use_kernel(f, num_steps):
+        _verlet_ode_step(f, t, y, dt, num_steps, tuple(args))
+        return t, y
+    f = getattr(f, 'py_func', f)
+
+    half_dt = 0.5 * dt
+    half_dt2 = 0.5 * dt * dt
+    stage = np.empty(2)
+    x_i, v_i = y[0]
+    a_current = f(t[0], y[0], *args)[1]
+    
+    for i in range(num_steps):
+        x_next = x_i + v_i * dt + half_dt2 * a_current
+        
+        stage[0] = x_next
+        stage[1] = v_i + half_dt * a_current
+        a_next = f(t[i + 1], stage, *args)[1]
+        
+        v_i = v_i + half_dt * (a_current + a_next)
+        x_i = x_next
+        y[i + 1, 0] = x_i
+        y[i + 1, 1] = v_i
+        
+        a_current = a_next
+    
+    return t, y
+
+
 def test_verlet_energy_conservation():
     
     print("=== Verlet Integration Energy Conservation ===\n")
@@ -2,15 +2,23 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from typing import List, Tuple
 
 
+_style_applied = False
+
+
 def setup_plot_style():
     
+    global _style_applied
+    if _style_applied:
+        return
     plt.style.use('seaborn-v0_8-darkgrid' if 'seaborn-v0_8-darkgrid' in plt.style.available else 'default')
     plt.rcParams['figure.figsize'] = (10, 6)
     plt.rcParams['font.size'] = 11
     plt.rcParams['lines.linewidth'] = 2
+    _style_applied = True
 
 
 def plot_trajectory_2d(x: np.ndarray, y: np.ndarray, title: str = "Trajectory",
@@ -19,16 +27,18 @@ def plot_trajectory_2d(x: np.ndarray, y: np.ndarray, title: str = "Trajectory",
     
     setup_plot_style()
     
-    plt.figure()
-    plt.plot(x, y, 'b-', linewidth=2)
-    plt.xlabel(xlabel)
-    plt.ylabel(ylabel)
-    plt.title(title)
-    plt.grid(True, alpha=0.3)
-    plt.axis('equal')
+    fig = Figure() if save_path else plt.figure()
+    ax = fig.subplots()
+    ax.plot(x, y, 'b-', linewidth=2)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    ax.grid(True, alpha=0.3)
+    ax.axis('equal')
     
     if save_path:
-        plt.savefig(save_path, dpi=150, bbox_inches='tight')
+        fig.savefig(save_path, dpi=150, bbox_inches='tight')
+        fig.clear()
     else:
         plt.show()
 
@@ -37,13 +47,14 @@ def plot_energy_conservation(times: np.ndarray, KE: np.ndarray, PE: np.ndarray,
                             total: np.ndarray, title: str = "Energy Conservation"):
     
     setup_plot_style()
+    dense = len(times) > 10000
     
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
     
     
-    ax1.plot(times, KE, 'r-', label='Kinetic', linewidth=2)
-    ax1.plot(times, PE, 'b-', label='Potential', linewidth=2)
-    ax1.plot(times, total, 'k--', label='Total', linewidth=2)
+    ax1.plot(times, KE, 'r-', label='Kinetic', linewidth=2, rasterized=dense)
+    ax1.plot(times, PE, 'b-', label='Potential', linewidth=2, rasterized=dense)
+    ax1.plot(times, total, 'k--', label='Total', linewidth=2, rasterized=dense)
     ax1.set_xlabel('Time (s)')
     ax1.set_ylabel('Energy (J)')
     ax1.set_title(title)
@@ -51,8 +62,9 @@ def plot_energy_conservation(times: np.ndarray, KE: np.ndarray, PE: np.ndarray,
     ax1.grid(True, alpha=0.3)
     
     
-    energy_drift = (total - total[0]) / total[0] * 100
-    ax2.plot(times, energy_drift, 'purple', linewidth=2)
+    E0 = total[0]
+    energy_drift = (total - E0) * (100.0 / max(abs(E0), 1e-300))
+    ax2.plot(times, energy_drift, 'purple', linewidth=2, rasterized=dense)
     ax2.set_xlabel('Time (s)')
     ax2.set_ylabel('Energy Drift (%)')
     ax2.set_title('Energy Conservation Error')
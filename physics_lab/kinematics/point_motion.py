@@ -1,57 +1,52 @@
 
 
+import math
+
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 
 
-def simulate_projectile_motion(v0: float, angle_deg: float, dt: float = 0.01, g: float = 9.81):
+def simulate_projectile_motion(v0: float, angle_deg: float, dt: float = 0.01, g: float = 9.81,
+                               dtype=np.float64):
     
-    angle = np.radians(angle_deg)
-    vx = v0 * np.cos(angle)
-    vy = v0 * np.sin(angle)
+    angle = math.radians(angle_deg)
+    vx = v0 * math.cos(angle)
+    vy = v0 * math.sin(angle)
     
     
-    x, y = 0.0, 0.0
+    m = 1.0
     
     
-    positions_x = [x]
-    positions_y = [y]
-    velocities = [np.sqrt(vx**2 + vy**2)]
-    times = [0.0]
-    energies = []
+    real = np.dtype(dtype).type
+    vx, vy, g, dt = real(vx), real(vy), real(g), real(dt)
     
     
-    m = 1.0
+    k_max = max(int(np.floor(2.0 * vy / (g * dt))) + 2, 1)
+    k = np.arange(k_max + 1, dtype=dtype)
+    vy_k = vy - g * dt * k
+    # Every sample is evaluated directly from k rather than accumulated step by
+    # step, so rounding error stays O(eps) per sample instead of growing O(N eps).
+    y_k = dt * (vy * k - 0.5 * g * dt * k * (k + 1.0))
+    
+    
+    below = np.flatnonzero(y_k[1:] < 0)
+    num_steps = below[0] + 1 if below.size else k_max
+    
+    times = k[:num_steps + 1] * dt
+    positions_x = vx * times
+    positions_y = y_k[:num_steps + 1]
+    positions_y[0] = 0.0
+    speed_sq = vx * vx + vy_k[:num_steps + 1] ** 2
+    velocities = np.sqrt(speed_sq)
+    energies = 0.5 * m * speed_sq[1:] + m * g * positions_y[1:]
     
-    t = 0.0
-    while y >= 0:
-        
-        vy -= g * dt
-        
-        
-        x += vx * dt
-        y += vy * dt
-        
-        t += dt
-        
-        
-        positions_x.append(x)
-        positions_y.append(y)
-        velocities.append(np.sqrt(vx**2 + vy**2))
-        times.append(t)
-        
-        
-        KE = 0.5 * m * (vx**2 + vy**2)
-        PE = m * g * y
-        E_total = KE + PE
-        energies.append(E_total)
-    
-    return np.array(times), np.array(positions_x), np.array(positions_y), np.array(velocities), np.array(energies)
+    return times, positions_x, positions_y, velocities, energies
 
 
 def plot_projectile_results(times, x, y, velocities, energies):
     
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 10))
+    fig = Figure(figsize=(12, 10))
+    ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
     
     
     ax1.plot(x, y, 'b-', linewidth=2)
@@ -84,8 +79,9 @@ def plot_projectile_results(times, x, y, velocities, energies):
     ax4.set_title('Energy Conservation Check')
     ax4.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig('projectile_motion.png', dpi=150)
+    fig.tight_layout()
+    fig.savefig('projectile_motion.png', dpi=150)
+    fig.clear()
     print("📊 Plot saved to projectile_motion.png")
 
 
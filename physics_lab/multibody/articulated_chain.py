@@ -15,16 +15,34 @@ class ArticulatedChain:
     
     def forward_kinematics(self):
         
-        positions = [np.array([0.0, 0.0])]  
-        cumulative_angle = 0
+        cum = np.cumsum(self.angles)
+        positions = np.empty((self.num_links + 1, 2))
+        positions[0] = 0.0
+        links = positions[1:]
+        np.cos(cum, out=links[:, 0])
+        np.sin(cum, out=links[:, 1])
+        links *= self.link_lengths[:, None]
+        np.cumsum(links, axis=0, out=links)
         
-        for i in range(self.num_links):
-            cumulative_angle += self.angles[i]
-            dx = self.link_lengths[i] * np.cos(cumulative_angle)
-            dy = self.link_lengths[i] * np.sin(cumulative_angle)
-            positions.append(positions[-1] + np.array([dx, dy]))
+        return positions
+    
+    def forward_kinematics_batch(self, angles_batch):
+        
+        angles_batch = np.asarray(angles_batch, dtype=float)
+        if angles_batch.ndim != 2 or angles_batch.shape[1] != self.num_links:
+            raise ValueError(f"angles_batch must have shape (B, {self.num_links}), "
+                             f"got {angles_batch.shape}")
+        
+        cum = np.cumsum(angles_batch, axis=1)
+        positions = np.empty((angles_batch.shape[0], self.num_links + 1, 2))
+        positions[:, 0] = 0.0
+        links = positions[:, 1:]
+        np.cos(cum, out=links[..., 0])
+        np.sin(cum, out=links[..., 1])
+        links *= self.link_lengths[:, None]
+        np.cumsum(links, axis=1, out=links)
         
-        return np.array(positions)
+        return positions
 
 
 if __name__ == "__main__":
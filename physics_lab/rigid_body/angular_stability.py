@@ -1,44 +1,75 @@
 
 
+import os
+import sys
+
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib import rc_context
+from matplotlib.figure import Figure
+
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from physics_lab._jit import njit, load_aot
+
+
+_MAX_TRACE_POINTS = 20000
+
+
+@njit(cache=True, fastmath=True)
+def _euler_equations_step_jit(I1, I2, I3, w0, w1, w2, dt, num_steps, out):
+    
+    c1 = (I2 - I3) / I1
+    c2 = (I3 - I1) / I2
+    c3 = (I1 - I2) / I3
+    
+    out[0, 0], out[0, 1], out[0, 2] = w0, w1, w2
+    for k in range(num_steps):
+        d0 = c1 * w1 * w2
+        d1 = c2 * w2 * w0
+        d2 = c3 * w0 * w1
+        w0 += d0 * dt
+        w1 += d1 * dt
+        w2 += d2 * dt
+        out[k + 1, 0], out[k + 1, 1], out[k + 1, 2] = w0, w1, w2
+
+
+_euler_equations_step = load_aot('_euler_equations_step', _euler_equations_step_jit)
 
 
 def tennis_racket_effect(I1: float, I2: float, I3: float,
-                         omega0: np.ndarray, dt: float = 0.001, duration: float = 20.0):
+                         omega0: np.ndarray, dt: float = 0.001, duration: float = 20.0,
+                         integrator_dtype=np.float64):
     
     num_steps = int(duration / dt)
+    real = np.dtype(integrator_dtype).type
     
-    omega = omega0.copy()
-    omegas = [omega.copy()]
-    times = [0.0]
+    omegas = np.empty((num_steps + 1, 3), dtype=integrator_dtype)
+    kernel = _euler_equations_step if omegas.dtype == np.float64 else _euler_equations_step_jit
+    kernel(real(I1), real(I2), real(I3),
+           real(omega0[0]), real(omega0[1]), real(omega0[2]),
+           real(dt), num_steps, omegas)
+    times = np.arange(num_steps + 1) * dt
     
-    for step in range(num_steps):
-        t = step * dt
-        
-        
-        omega_dot = np.array([
-            ((I2 - I3) / I1) * omega[1] * omega[2],
-            ((I3 - I1) / I2) * omega[2] * omega[0],
-            ((I1 - I2) / I3) * omega[0] * omega[1]
-        ])
-        
-        omega += omega_dot * dt
-        
-        omegas.append(omega.copy())
-        times.append(t + dt)
-    
-    return np.array(times), np.array(omegas)
+    return times, omegas
 
 
+@rc_context({'path.simplify': True, 'path.simplify_threshold': 1.0})
 def plot_angular_stability(times, omegas, title="Angular Stability"):
     
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+    times = np.asarray(times).astype(np.float32, copy=False)
+    omegas = np.asarray(omegas).astype(np.float32, copy=False)
+    stride = max(1, -(-len(times) // _MAX_TRACE_POINTS))
+    trace = omegas[::stride]
+    
+    fig = Figure(figsize=(12, 10))
+    ax1 = fig.add_subplot(2, 1, 1)
     
     
-    ax1.plot(times, omegas[:, 0], 'r-', label='ω₁', linewidth=2)
-    ax1.plot(times, omegas[:, 1], 'g-', label='ω₂', linewidth=2)
-    ax1.plot(times, omegas[:, 2], 'b-', label='ω₃', linewidth=2)
+    ax1.plot(times, omegas[:, 0], 'r-', label='ω₁', linewidth=2, rasterized=True)
+    ax1.plot(times, omegas[:, 1], 'g-', label='ω₂', linewidth=2, rasterized=True)
+    ax1.plot(times, omegas[:, 2], 'b-', label='ω₃', linewidth=2, rasterized=True)
     ax1.set_xlabel('Time (s)')
     ax1.set_ylabel('Angular Velocity (rad/s)')
     ax1.set_title('Angular Velocity Components')
@@ -46,8 +77,8 @@ def plot_angular_stability(times, omegas, title="Angular Stability"):
     ax1.grid(True, alpha=0.3)
     
     
-    ax2 = plt.subplot(2, 1, 2, projection='3d')
-    ax2.plot(omegas[:, 0], omegas[:, 1], omegas[:, 2], 'purple', linewidth=1)
+    ax2 = fig.add_subplot(2, 1, 2, projection='3d')
+    ax2.plot(trace[:, 0], trace[:, 1], trace[:, 2], 'purple', linewidth=1, rasterized=True)
     ax2.scatter(omegas[0, 0], omegas[0, 1], omegas[0, 2], 
                 c='green', s=100, label='Start')
     ax2.set_xlabel('ω₁ (rad/s)')
@@ -56,9 +87,10 @@ def plot_angular_stability(times, omegas, title="Angular Stability"):
     ax2.set_title('Angular Velocity Phase Space')
     ax2.legend()
     
-    plt.suptitle(title, fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('angular_stability.png', dpi=150)
+    fig.suptitle(title, fontsize=14, fontweight='bold')
+    fig.tight_layout()
+    fig.savefig('angular_stability.png', dpi=150)
+    fig.clear()
     print("📊 Plot saved to angular_stability.png")
 
 
@@ -1,7 +1,69 @@
 
 
+import os
+import sys
+from functools import lru_cache
+
 import numpy as np
 
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from physics_lab.core_math._fast import _fclose
+
+
+@lru_cache(maxsize=1024)
+def _sphere_diagonal(mass: float, radius: float) -> tuple:
+    
+    I_val = (2/5) * mass * radius**2
+    return (I_val, I_val, I_val)
+
+
+@lru_cache(maxsize=1024)
+def _box_diagonal(mass: float, width: float, height: float, depth: float) -> tuple:
+    
+    Ixx = (1/12) * mass * (height**2 + depth**2)
+    Iyy = (1/12) * mass * (width**2 + depth**2)
+    Izz = (1/12) * mass * (width**2 + height**2)
+    return (Ixx, Iyy, Izz)
+
+
+@lru_cache(maxsize=1024)
+def _cylinder_diagonal(mass: float, radius: float, length: float, axis: str) -> tuple:
+    
+    I_perp = (1/12) * mass * (3 * radius**2 + length**2)
+    I_axis = 0.5 * mass * radius**2
+    
+    if axis == 'z':
+        return (I_perp, I_perp, I_axis)
+    elif axis == 'y':
+        return (I_perp, I_axis, I_perp)
+    else:  
+        return (I_axis, I_perp, I_perp)
+
+
+@lru_cache(maxsize=1024)
+def _rod_diagonal(mass: float, length: float, axis: str) -> tuple:
+    
+    I_perp = (1/12) * mass * length**2
+    I_axis = 0  
+    
+    if axis == 'x':
+        return (I_axis, I_perp, I_perp)
+    elif axis == 'y':
+        return (I_perp, I_axis, I_perp)
+    else:  
+        return (I_perp, I_perp, I_axis)
+
+
+def _diagonal(cached, *args) -> tuple:
+    
+    try:
+        return cached(*args)
+    except TypeError:
+        return cached.__wrapped__(*args)
+
 
 class InertiaTensor:
     
@@ -10,58 +72,78 @@ class InertiaTensor:
         assert I.shape == (3, 3), "Inertia tensor must be 3x3"
         self.I = I
     
+    @property
+    def I(self) -> np.ndarray:
+        return self._I
+    
+    @I.setter
+    def I(self, value: np.ndarray):
+        self._I = value
+        self._principal = None
+    
     def __repr__(self):
         return f"InertiaTensor(\n{self.I}\n)"
     
     @staticmethod
     def sphere(mass: float, radius: float) -> 'InertiaTensor':
         
-        I_val = (2/5) * mass * radius**2
-        return InertiaTensor(np.diag([I_val, I_val, I_val]))
+        return InertiaTensor(np.diag(_diagonal(_sphere_diagonal, mass, radius)))
     
     @staticmethod
     def box(mass: float, width: float, height: float, depth: float) -> 'InertiaTensor':
         
-        Ixx = (1/12) * mass * (height**2 + depth**2)
-        Iyy = (1/12) * mass * (width**2 + depth**2)
-        Izz = (1/12) * mass * (width**2 + height**2)
-        return InertiaTensor(np.diag([Ixx, Iyy, Izz]))
+        return InertiaTensor(np.diag(_diagonal(_box_diagonal, mass, width, height, depth)))
     
     @staticmethod
-    def cylinder(mass: float, radius: float, length: float, axis: str = 'z') -> 'InertiaTensor':
+    def box_batch(mass, width, height, depth) -> np.ndarray:
         
-        I_perp = (1/12) * mass * (3 * radius**2 + length**2)
-        I_axis = 0.5 * mass * radius**2
+        mass, width, height, depth = np.broadcast_arrays(
+            *(np.asarray(a, dtype=float) for a in (mass, width, height, depth)))
+        w2, h2, d2 = width**2, height**2, depth**2
+        I = np.zeros(mass.shape + (3, 3))
+        I[..., 0, 0] = (1/12) * mass * (h2 + d2)
+        I[..., 1, 1] = (1/12) * mass * (w2 + d2)
+        I[..., 2, 2] = (1/12) * mass * (w2 + h2)
+        return I
+    
+    @staticmethod
+    def cylinder(mass: float, radius: float, length: float, axis: str = 'z') -> 'InertiaTensor':
         
-        if axis == 'z':
-            return InertiaTensor(np.diag([I_perp, I_perp, I_axis]))
-        elif axis == 'y':
-            return InertiaTensor(np.diag([I_perp, I_axis, I_perp]))
-        else:  
-            return InertiaTensor(np.diag([I_axis, I_perp, I_perp]))
+        return InertiaTensor(np.diag(_diagonal(_cylinder_diagonal, mass, radius, length, axis)))
     
     @staticmethod
     def rod(mass: float, length: float, axis: str = 'x') -> 'InertiaTensor':
         
-        I_perp = (1/12) * mass * length**2
-        I_axis = 0  
-        
-        if axis == 'x':
-            return InertiaTensor(np.diag([I_axis, I_perp, I_perp]))
-        elif axis == 'y':
-            return InertiaTensor(np.diag([I_perp, I_axis, I_perp]))
-        else:  
-            return InertiaTensor(np.diag([I_perp, I_perp, I_axis]))
+        return InertiaTensor(np.diag(_diagonal(_rod_diagonal, mass, length, axis)))
     
     def principal_axes(self) -> tuple:
         
-        eigenvalues, eigenvectors = np.linalg.eig(self.I)
-        return eigenvalues, eigenvectors
+        if self._principal is None:
+            I = self._I
+            if np.count_nonzero(I - np.diag(np.diag(I))) == 0:
+                diagonal = np.diag(I).astype(float)
+                order = np.argsort(diagonal, kind='stable')
+                eigenvalues, eigenvectors = diagonal[order], np.eye(3)[:, order]
+            else:
+                eigenvalues, eigenvectors = np.linalg.eigh(I)
+            eigenvalues.setflags(write=False)
+            eigenvectors.setflags(write=False)
+            self._principal = (eigenvalues, eigenvectors)
+        return self._principal
     
     def rotate(self, R: np.ndarray) -> 'InertiaTensor':
         
         I_rotated = R @ self.I @ R.T
         return InertiaTensor(I_rotated)
+    
+    @staticmethod
+    def rotate_batch(R: np.ndarray, I: np.ndarray) -> np.ndarray:
+        
+        R = np.asarray(R, dtype=float)
+        I = np.asarray(I, dtype=float)
+        if R.shape[-2:] != (3, 3) or I.shape[-2:] != (3, 3):
+            raise ValueError(f"R and I must be stacks of 3x3 matrices, got {R.shape} and {I.shape}")
+        return R @ I @ np.swapaxes(R, -1, -2)
 
 
 def demonstrate_inertia_properties():
@@ -104,7 +186,7 @@ def demonstrate_inertia_properties():
     print(f"I_center = {I_center:.4f} kg⋅m²")
     print(f"I_end (direct) = {I_end:.4f} kg⋅m²")
     print(f"I_end (parallel axis) = {I_parallel:.4f} kg⋅m²")
-    print(f"Match: {np.isclose(I_end, I_parallel)}\n")
+    print(f"Match: {_fclose(I_end, I_parallel)}\n")
 
 
 if __name__ == "__main__":
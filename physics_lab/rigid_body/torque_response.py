@@ -1,58 +1,108 @@
 
 
+import math
+import os
+import sys
+
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 
+try:
+    from scipy.integrate import solve_ivp
+except ImportError:
+    solve_ivp = None
 
-def simulate_torque_response(I: float, torque_func, omega0: float = 0.0,
-                            theta0: float = 0.0, dt: float = 0.01, duration: float = 5.0):
-    
-    num_steps = int(duration / dt)
-    
-    theta = theta0
-    omega = omega0
-    
-    thetas = [theta]
-    omegas = [omega]
-    alphas = []
-    energies = []
-    times = [0.0]
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from physics_lab._jit import njit, is_jitted
+
+
+@njit(cache=True)
+def _torque_response_step(I, torque_func, theta, omega, dt, num_steps,
+                          thetas, omegas, alphas, energies):
     
+    thetas[0] = theta
+    omegas[0] = omega
+    half_I = 0.5 * I
     for step in range(num_steps):
-        t = step * dt
-        
-        
-        tau = torque_func(theta, omega, t)
+        tau = torque_func(theta, omega, step * dt)
         alpha = tau / I
         
-        
         omega += alpha * dt
         theta += omega * dt
         
-        
-        thetas.append(theta)
-        omegas.append(omega)
-        alphas.append(alpha)
-        times.append(t + dt)
-        
-        
-        KE_rot = 0.5 * I * omega**2
-        energies.append(KE_rot)
+        thetas[step + 1] = theta
+        omegas[step + 1] = omega
+        alphas[step] = alpha
+        energies[step] = half_I * omega * omega
+
+
+def _torque_response_lsoda(I, torque_func, theta0, omega0, times):
+    
+    if solve_ivp is None:
+        raise ImportError("backend='lsoda' requires scipy")
+    
+    def fun(t, y):
+        return [y[1], torque_func(y[0], y[1], t) / I]
+    
+    sol = solve_ivp(fun, (times[0], times[-1]), [theta0, omega0],
+                    method='LSODA', dense_output=True, rtol=1e-8)
+    if not sol.success:
+        raise RuntimeError(f"LSODA integration failed: {sol.message}")
+    
+    thetas, omegas = sol.sol(times)
+    alphas = np.fromiter((torque_func(th, om, t) for th, om, t
+                          in zip(thetas[:-1], omegas[:-1], times[:-1])),
+                         dtype=float, count=len(times) - 1) / I
+    energies = 0.5 * I * omegas[1:] ** 2
+    
+    return thetas, omegas, alphas, energies
+
+
+def simulate_torque_response(I: float, torque_func, omega0: float = 0.0,
+                            theta0: float = 0.0, dt: float = 0.01, duration: float = 5.0,
+                            backend: str = 'euler'):
+    
+    num_steps = int(duration / dt)
+    
+    times = np.arange(num_steps + 1) * dt
+    
+    if backend == 'lsoda':
+        thetas, omegas, alphas, energies = _torque_response_lsoda(
+            float(I), torque_func, float(theta0), float(omega0), times)
+        return times, thetas, omegas, alphas, energies
+    if backend != 'euler':
+        raise ValueError(f"Unknown backend {backend!r}; expected 'euler' or 'lsoda'")
+    
+    thetas = np.empty(num_steps + 1)
+    omegas = np.empty(num_steps + 1)
+    alphas = np.empty(num_steps)
+    energies = np.empty(num_steps)
+    
+    kernel = _torque_response_step
+    if not is_jitted(torque_func):
+        kernel = getattr(kernel, 'py_func', kernel)
+    kernel(float(I), torque_func, float(theta0), float(omega0), float(dt), num_steps,
+           thetas, omegas, alphas, energies)
     
-    return (np.array(times), np.array(thetas), np.array(omegas), 
-            np.array(alphas), np.array(energies))
+    return times, thetas, omegas, alphas, energies
 
 
+@njit(cache=True)
 def constant_torque(theta, omega, t):
     
     return 2.0  
 
 
+@njit(cache=True)
 def sinusoidal_torque(theta, omega, t):
     
-    return 2.0 * np.sin(2 * np.pi * t)
+    return 2.0 * math.sin(2 * math.pi * t)
 
 
+@njit(cache=True)
 def damped_spring_torque(theta, omega, t, k=5.0, b=0.5):
     
     return -k * theta - b * omega
@@ -60,7 +110,8 @@ def damped_spring_torque(theta, omega, t, k=5.0, b=0.5):
 
 def plot_rotational_motion(times, thetas, omegas, alphas, energies, title="Rotational Motion"):
     
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 10))
+    fig = Figure(figsize=(12, 10))
+    ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
     
     
     ax1.plot(times, np.degrees(thetas), 'b-', linewidth=2)
@@ -90,9 +141,10 @@ def plot_rotational_motion(times, thetas, omegas, alphas, energies, title="Rotat
     ax4.set_title('Rotational Kinetic Energy')
     ax4.grid(True, alpha=0.3)
     
-    plt.suptitle(title, fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('torque_response.png', dpi=150)
+    fig.suptitle(title, fontsize=14, fontweight='bold')
+    fig.tight_layout()
+    fig.savefig('torque_response.png', dpi=150)
+    fig.clear()
     print("📊 Plot saved to torque_response.png")
 
 
@@ -14,7 +14,8 @@ if _project_root not in sys.path:
 from models.mass_spring_1d import MassSpring1D
 from physics_lab.integration.euler import forward_euler
 from physics_lab.integration.rk4 import rk4
-from pipeline.export import run_and_export
+from physics_lab.integration.verlet import velocity_verlet_ode
+from pipeline.export import npz_path_for, run_and_export
 from pipeline.verify import verify_energy
 from visualization.plot_results import plot_from_json
 
@@ -34,6 +35,7 @@ OUTPUT_DIR = os.path.join(_project_root, "output")
 SOLVERS = [
     (forward_euler, "Forward Euler"),
     (rk4,           "RK4"),
+    (velocity_verlet_ode, "Velocity Verlet"),
 ]
 
 
@@ -67,6 +69,7 @@ def main():
             t_span=T_SPAN,
             y0=y0,
             output_path=json_path,
+            write_npz=True,
         )
         print(f"    Exported: {path}")
         json_paths[solver_name] = path
@@ -95,19 +98,27 @@ def main():
 
     records = {}
     for solver_fn, solver_name in SOLVERS:
-        with open(json_paths[solver_name], "r") as fp:
-            data = json.load(fp)
-        history = data["history"]
-        E0 = history[0]["E"]
-        max_drift = max(abs(h["E"] - E0) for h in history)
-        final_x = history[-1]["x"]
-        final_v = history[-1]["v"]
+        json_path = json_paths[solver_name]
+        npz_path = npz_path_for(json_path)
+        if (os.path.exists(npz_path)
+                and os.stat(npz_path).st_mtime_ns >= os.stat(json_path).st_mtime_ns):
+            with np.load(npz_path) as columns:
+                E = columns["E"]
+                final_x = float(columns["x"][-1])
+                final_v = float(columns["v"][-1])
+        else:
+            with open(json_path, "r") as fp:
+                data = json.load(fp)
+            history = data["history"]
+            E = np.fromiter((h["E"] for h in history), dtype=np.float64, count=len(history))
+            final_x = history[-1]["x"]
+            final_v = history[-1]["v"]
         records[solver_name] = {
-            "max_drift": max_drift,
+            "max_drift": float(np.abs(E - E[0]).max()),
             "final_x": final_x,
             "final_v": final_v,
-            "E0": E0,
-            "E_final": history[-1]["E"],
+            "E0": float(E[0]),
+            "E_final": float(E[-1]),
         }
 
     
@@ -122,8 +133,8 @@ def main():
         )
 
     
-    if len(records) == 2:
-        names = [name for _, name in SOLVERS]
+    if len(records) >= 2:
+        names = [name for _, name in SOLVERS[:2]]
         dx = abs(records[names[0]]["final_x"] - records[names[1]]["final_x"])
         dv = abs(records[names[0]]["final_v"] - records[names[1]]["final_v"])
         print(f"\nTrajectory difference at t = {T_SPAN[1]}:")
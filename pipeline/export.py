@@ -5,14 +5,29 @@ from __future__ import annotations
 import json
 import os
 import sys
-from typing import Callable, Tuple
+from typing import Callable, Sequence, Tuple
 
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if _project_root not in sys.path:
     sys.path.insert(0, _project_root)
 
+from pipeline.kernels import compiled_derivatives, total_energy_batch
+
+HISTORY_COLUMNS = ("t", "x", "v", "E")
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def npz_path_for(json_path: str) -> str:
+    
+    return os.path.splitext(json_path)[0] + ".npz"
+
 
 def run_and_export(
     model,
@@ -22,26 +37,38 @@ def run_and_export(
     t_span: Tuple[float, float],
     y0: np.ndarray,
     output_path: str,
+    write_npz: bool = False,
+    columns: Sequence[str] = HISTORY_COLUMNS,
 ) -> str:
     
+    columns = tuple(columns)
+    unknown = [name for name in columns if name not in HISTORY_COLUMNS]
+    if unknown:
+        raise ValueError(
+            f"Unknown history columns {unknown}; expected a subset of {HISTORY_COLUMNS}"
+        )
     
-    def f(t, y):
-        dx, dv = model.derivatives((y[0], y[1]), t)
-        return np.array([dx, dv])
+    spec = compiled_derivatives(model)
+    if spec is not None:
+        f, args = spec
+        t_arr, y_arr = solver(f, y0, t_span, dt, args=args)
+    else:
+        def f(t, y):
+            dx, dv = model.derivatives((y[0], y[1]), t)
+            return np.array([dx, dv])
 
-    
-    t_arr, y_arr = solver(f, y0, t_span, dt)
+        t_arr, y_arr = solver(f, y0, t_span, dt)
 
     
-    history = []
-    for i in range(len(t_arr)):
-        state = (float(y_arr[i, 0]), float(y_arr[i, 1]))
-        history.append({
-            "t": float(t_arr[i]),
-            "x": state[0],
-            "v": state[1],
-            "E": float(model.total_energy(state)),
-        })
+    x_arr = y_arr[:, 0]
+    v_arr = y_arr[:, 1]
+    E_arr = total_energy_batch(model, x_arr, v_arr)
+
+    arrays = {"t": t_arr, "x": x_arr, "v": v_arr, "E": E_arr}
+    column_lists = [
+        np.asarray(arrays[name], dtype=np.float64).tolist() for name in columns
+    ]
+    history = [dict(zip(columns, row)) for row in zip(*column_lists)]
 
     
     parameters = {}
@@ -62,7 +89,28 @@ def run_and_export(
 
     
     os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
-    with open(output_path, "w") as fp:
-        json.dump(payload, fp, indent=2)
+    finite = all(np.isfinite(arrays[name]).all() for name in columns)
+    if orjson is not None and finite:
+        data = orjson.dumps(
+            payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+        with open(output_path, "wb") as fp:
+            fp.write(data)
+    else:
+        encoder = json.JSONEncoder(indent=2)
+        with open(output_path, "w", buffering=_WRITE_BUFFER_SIZE) as fp:
+            fp.writelines(encoder.iterencode(payload))
+
+    npz_path = npz_path_for(output_path)
+    if write_npz:
+        np.savez(
+            npz_path,
+            t=np.asarray(t_arr, dtype=np.float64),
+            x=np.asarray(x_arr, dtype=np.float64),
+            v=np.asarray(v_arr, dtype=np.float64),
+            E=E_arr,
+        )
+    elif os.path.exists(npz_path):
+        os.remove(npz_path)
 
     return os.path.abspath(output_path)
\ No newline at end of file
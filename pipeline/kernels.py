@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import os
+import sys
+
+import numpy as np
+
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from core.gravity import UniformGravityField
+from models.mass_spring_1d import MassSpring1D
+from models.rigid_body_1d import RigidBody1D
+from physics_lab._jit import njit
+
+
+@njit(cache=True)
+def mass_spring_rhs(t, y, omega_sq):
+    
+    out = np.empty(2)
+    out[0] = y[1]
+    out[1] = -omega_sq * y[0]
+    return out
+
+
+@njit(cache=True)
+def mass_spring_accel(x, omega_sq):
+    
+    return -omega_sq * x
+
+
+@njit(cache=True)
+def uniform_gravity_rhs(t, y, accel):
+    
+    out = np.empty(2)
+    out[0] = y[1]
+    out[1] = accel
+    return out
+
+
+@njit(cache=True)
+def uniform_gravity_accel(x, accel):
+    
+    return accel
+
+
+def _uniform_gravity(model):
+    
+    if isinstance(model, RigidBody1D) and isinstance(model.gravity_field, UniformGravityField):
+        return model.gravity_field
+    return None
+
+
+def compiled_derivatives(model):
+    
+    if isinstance(model, MassSpring1D):
+        return mass_spring_rhs, (model.stiffness / model.mass,)
+    field = _uniform_gravity(model)
+    if field is not None:
+        return uniform_gravity_rhs, (field.force(model.mass) / model.mass,)
+    return None
+
+
+def compiled_acceleration(model):
+    
+    if isinstance(model, MassSpring1D):
+        return mass_spring_accel, (model.stiffness / model.mass,)
+    field = _uniform_gravity(model)
+    if field is not None:
+        return uniform_gravity_accel, (field.force(model.mass) / model.mass,)
+    return None
+
+
+def total_energy_batch(model, x, v) -> np.ndarray:
+    
+    batch = getattr(model, "total_energy_batch", None)
+    if batch is not None:
+        return np.asarray(batch(x, v), dtype=np.float64)
+    field = _uniform_gravity(model)
+    if field is not None:
+        return 0.5 * model.mass * v * v + model.mass * field.g * x
+    return np.fromiter(
+        (model.total_energy(state) for state in zip(np.asarray(x).tolist(), np.asarray(v).tolist())),
+        dtype=np.float64,
+        count=len(x),
+    )
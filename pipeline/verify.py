@@ -5,11 +5,26 @@ from __future__ import annotations
 import json
 import sys
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def verify_energy(json_path: str, tolerance: float = 1e-3) -> bool:
     
-    with open(json_path, "r") as fp:
-        data = json.load(fp)
+    if orjson is not None:
+        with open(json_path, "rb") as fp:
+            raw = fp.read()
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            data = json.loads(raw)
+    else:
+        with open(json_path, "r") as fp:
+            data = json.load(fp)
 
     metadata = data["metadata"]
     history = data["history"]
@@ -18,13 +33,11 @@ def verify_energy(json_path: str, tolerance: float = 1e-3) -> bool:
         print("ERROR: History is empty.")
         return False
 
-    E0 = history[0]["E"]
-    max_drift = 0.0
-
-    for entry in history:
-        drift = abs(entry["E"] - E0)
-        if drift > max_drift:
-            max_drift = drift
+    E = np.fromiter(
+        (entry["E"] for entry in history), dtype=np.float64, count=len(history)
+    )
+    E0 = E[0]
+    max_drift = float(np.max(np.abs(E - E0)))
 
     solver = metadata["solver"]
     dt = metadata["dt"]
@@ -38,7 +51,7 @@ def verify_energy(json_path: str, tolerance: float = 1e-3) -> bool:
     print(f"  Max |E(t) - E(0)| : {max_drift:.6e}")
     print(f"  Tolerance          : {tolerance:.6e}")
 
-    if max_drift > tolerance:
+    if not max_drift <= tolerance:
         print(f"  RESULT : FAIL")
         return False
 
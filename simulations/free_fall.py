@@ -13,6 +13,7 @@ from core.gravity import UniformGravityField
 from models.rigid_body_1d import RigidBody1D
 from physics_lab.integration.euler import forward_euler
 from physics_lab.integration.rk4 import rk4
+from pipeline.kernels import compiled_derivatives, total_energy_batch
 
 
 
@@ -41,11 +42,12 @@ def analytical_velocity(t: np.ndarray) -> np.ndarray:
 
 def l2_error(numerical: np.ndarray, exact: np.ndarray) -> float:
     
-    diff_norm = np.linalg.norm(numerical - exact)
-    exact_norm = np.linalg.norm(exact)
-    if exact_norm == 0:
-        return diff_norm
-    return diff_norm / exact_norm
+    diff = numerical - exact
+    diff_sq = np.dot(diff, diff)
+    exact_sq = np.dot(exact, exact)
+    if exact_sq == 0:
+        return float(np.sqrt(diff_sq))
+    return float(np.sqrt(diff_sq / exact_sq))
 
 
 
@@ -60,22 +62,24 @@ def run_simulation(integrator, integrator_name: str, dt: float):
 
     
     
-    def f(t, y):
-        dx, dv = body.derivatives((y[0], y[1]), t)
-        return np.array([dx, dv])
-
     y0 = np.array([X0, V0])
-    t_arr, y_arr = integrator(f, y0, T_SPAN, dt)
+    spec = compiled_derivatives(body)
+    if spec is not None:
+        f, args = spec
+        t_arr, y_arr = integrator(f, y0, T_SPAN, dt, args=args)
+    else:
+        def f(t, y):
+            dx, dv = body.derivatives((y[0], y[1]), t)
+            return np.array([dx, dv])
+
+        t_arr, y_arr = integrator(f, y0, T_SPAN, dt)
 
     
     positions = y_arr[:, 0]
     velocities = y_arr[:, 1]
 
     
-    energies = np.array([
-        body.total_energy((positions[i], velocities[i]))
-        for i in range(len(t_arr))
-    ])
+    energies = total_energy_batch(body, positions, velocities)
 
     
     x_exact = analytical_position(t_arr)
@@ -136,17 +140,14 @@ def main():
             step = max(1, len(t) // 20)
             print(f"\n--- {integ_name}  (dt={dt}) ---")
             print(f"{'t':>8s} {'x':>12s} {'v':>12s} {'E':>14s} {'drift%':>12s}")
-            for i in range(0, len(t), step):
-                print(
-                    f"{t[i]:8.4f} {res['x'][i]:12.6f} {res['v'][i]:12.6f} "
-                    f"{res['energy'][i]:14.6f} {res['drift_pct'][i]:12.6e}"
-                )
-            
-            i = len(t) - 1
-            print(
-                f"{t[i]:8.4f} {res['x'][i]:12.6f} {res['v'][i]:12.6f} "
-                f"{res['energy'][i]:14.6f} {res['drift_pct'][i]:12.6e}"
+            table = np.column_stack(
+                (t, res["x"], res["v"], res["energy"], res["drift_pct"])
             )
+            rows = table[::step].tolist() + [table[-1].tolist()]
+            print("\n".join(
+                f"{ti:8.4f} {xi:12.6f} {vi:12.6f} {Ei:14.6f} {di:12.6e}"
+                for ti, xi, vi, Ei, di in rows
+            ))
 
     
     
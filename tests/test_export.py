@@ -0,0 +1,70 @@
+import json
+import math
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+import pipeline.export as export
+from pipeline.verify import verify_energy
+from physics_lab.integration.euler import forward_euler
+
+
+class BlowUpModel:
+
+    def derivatives(self, state, t):
+        x, v = state
+        return (v, -x)
+
+    def total_energy(self, state):
+        x, v = state
+        return 0.5 * (x * x + v * v) if x > 0.5 else float("nan")
+
+
+def _export(path, use_orjson):
+    saved = export.orjson
+    if not use_orjson:
+        export.orjson = None
+    try:
+        export.run_and_export(
+            model=BlowUpModel(),
+            solver=forward_euler,
+            solver_name="Forward Euler",
+            dt=0.1,
+            t_span=(0.0, 2.0),
+            y0=np.array([1.0, 0.0]),
+            output_path=path,
+        )
+    finally:
+        export.orjson = saved
+    with open(path, "rb") as fp:
+        return fp.read()
+
+
+def test_non_finite_energies_match_across_writers():
+    with tempfile.TemporaryDirectory() as tmp:
+        fast = _export(os.path.join(tmp, "fast.json"), use_orjson=True)
+        plain = _export(os.path.join(tmp, "plain.json"), use_orjson=False)
+
+        assert fast == plain
+        history = json.loads(fast)["history"]
+        assert math.isnan(history[-1]["E"])
+
+
+def test_verify_fails_on_non_finite_energies():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "run.json")
+        _export(path, use_orjson=True)
+
+        assert verify_energy(path, tolerance=1e-3) is False
+
+
+if __name__ == "__main__":
+    test_non_finite_energies_match_across_writers()
+    test_verify_fails_on_non_finite_energies()
+    print("ok")
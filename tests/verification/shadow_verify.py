@@ -3,93 +3,85 @@
 
 
 import math
+import os
+import sys
 
-class Vec3:
-    def __init__(self, x, y, z):
-        self.x, self.y, self.z = x, y, z
-    def __add__(self, o): return Vec3(self.x+o.x, self.y+o.y, self.z+o.z)
-    def __sub__(self, o): return Vec3(self.x-o.x, self.y-o.y, self.z-o.z)
-    def __mul__(self, s): return Vec3(self.x*s, self.y*s, self.z*s)
-    def magnitude(self): return math.sqrt(self.x**2 + self.y**2 + self.z**2)
-    def dot(self, o): return self.x*o.x + self.y*o.y + self.z*o.z
-
-class RigidBody:
-    def __init__(self, m, pos):
-        self.mass = m
-        self.inv_mass = 1.0/m if m > 0 else 0
-        self.position = pos
-        self.velocity = Vec3(0,0,0)
-        self.force = Vec3(0,0,0)
+import numpy as np
+
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from physics_lab._jit import njit
+
+
+@njit(cache=True)
+def simulate(steps, dt, mass, k, rest, p0, anchor):
     
-    def apply_force(self, f):
-        self.force = self.force + f
-        
-    def integrate(self, dt):
-        
-        accel = self.force * self.inv_mass
-        self.velocity = self.velocity + accel * dt
-        self.position = self.position + self.velocity * dt
-        self.force = Vec3(0,0,0)
-
-class SpringModel:
-    def __init__(self, body, anchor, k, rest=0):
-        self.body = body
-        self.anchor = anchor
-        self.k = k
-        self.rest = rest
-        
-    def update_force(self):
-        d = self.body.position - self.anchor
-        dist = d.magnitude()
-        if dist < 1e-6: return
-        disp = dist - self.rest
-        force_mag = -self.k * disp
-        direction = d * (1.0/dist)
-        self.body.apply_force(direction * force_mag)
-        
-    def get_kinetic_energy(self):
-        v_sq = self.body.velocity.dot(self.body.velocity)
-        return 0.5 * self.body.mass * v_sq
-        
-    def get_potential_energy(self):
-        d = self.body.position - self.anchor
-        disp = d.magnitude() - self.rest
-        return 0.5 * self.k * disp**2
+    inv_mass = 1.0 / mass if mass > 0 else 0.0
+    px, py, pz = p0[0], p0[1], p0[2]
+    ax, ay, az = anchor[0], anchor[1], anchor[2]
+    vx = vy = vz = 0.0
+
+    t = np.empty(steps + 1)
+    total = np.empty(steps + 1)
+
+    for i in range(steps + 1):
+        dx = px - ax
+        dy = py - ay
+        dz = pz - az
+        dist = math.sqrt(dx * dx + dy * dy + dz * dz)
+
+        ke = 0.5 * mass * (vx * vx + vy * vy + vz * vz)
+        disp = dist - rest
+        pe = 0.5 * k * disp * disp
+        t[i] = i * dt
+        total[i] = ke + pe
+
+        fx = fy = fz = 0.0
+        if dist >= 1e-6:
+            force_mag = -k * disp
+            inv_dist = 1.0 / dist
+            fx = dx * inv_dist * force_mag
+            fy = dy * inv_dist * force_mag
+            fz = dz * inv_dist * force_mag
+
+        vx = vx + fx * inv_mass * dt
+        vy = vy + fy * inv_mass * dt
+        vz = vz + fz * inv_mass * dt
+        px = px + vx * dt
+        py = py + vy * dt
+        pz = pz + vz * dt
+
+    return t, total
 
 def run_verification():
     print("=== Shadow Verification (Python) ===")
     
     
-    mass = RigidBody(2.0, Vec3(2.0, 0, 0))
-    spring = SpringModel(mass, Vec3(0,0,0), 10.0)
-    
     dt = 0.01
     steps = 200
     
+    t, totals = simulate(
+        steps, dt, 2.0, 10.0, 0.0,
+        np.array([2.0, 0.0, 0.0]), np.zeros(3),
+    )
     
-    
-    initial_total = spring.get_kinetic_energy() + spring.get_potential_energy()
+    initial_total = totals[0]
     print(f"Baseline Energy: {initial_total:.6f} J")
     
     valid = True
     
     print("time, total, drift%")
+    drift = (totals - initial_total) / initial_total * 100.0
     for i in range(steps+1):
-        ke = spring.get_kinetic_energy()
-        pe = spring.get_potential_energy()
-        total = ke + pe
-        drift = (total - initial_total) / initial_total * 100.0
-        
         if i % 20 == 0:
-            print(f"{i*dt:.2f}, {total:.6f}, {drift:.4f}%")
+            print(f"{t[i]:.2f}, {totals[i]:.6f}, {drift[i]:.4f}%")
             
-        if abs(drift) > 5.0:
+        if abs(drift[i]) > 5.0:
             print("VIOLATION")
             valid = False
             break
-            
-        spring.update_force()
-        mass.integrate(dt)
         
     if valid:
         print("SUCCESS: Logic Verified within tolerances.")
@@ -2,39 +2,200 @@
 
 from __future__ import annotations
 
+import io
 import json
+import math
 import os
 import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import matplotlib
 matplotlib.use("Agg")          
+import matplotlib.image as mimage
 import matplotlib.pyplot as plt
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from physics_lab._jit import HAVE_NUMBA, KERNEL_MIN_STEPS, njit
+
+_COLUMN_DTYPE = np.dtype([("t", np.float64), ("x", np.float64), ("E", np.float64)])
+_PLOT_DPI = 150
+_FIGSIZE = (10, 5)
+_PLOT_FORMATS = ("png", "svg")
+_PNG_COMPRESS_LEVEL = int(os.environ.get("PLAB_PNG_COMPRESS", "1"))
+
+
+@njit(cache=True)
+def _lttb(x, y, n_out):
+    
+    n = len(x)
+    idx = np.empty(n_out, np.int64)
+    idx[0] = 0
+    idx[n_out - 1] = n - 1
+    every = (n - 2) / (n_out - 2)
+    a = 0
+
+    for i in range(n_out - 2):
+        avg_start = int(math.floor((i + 1) * every)) + 1
+        avg_end = min(int(math.floor((i + 2) * every)) + 1, n)
+        avg_x = 0.0
+        avg_y = 0.0
+        for j in range(avg_start, avg_end):
+            avg_x += x[j]
+            avg_y += y[j]
+        count = avg_end - avg_start
+        avg_x /= count
+        avg_y /= count
+
+        range_start = int(math.floor(i * every)) + 1
+        range_end = int(math.floor((i + 1) * every)) + 1
+        ax = x[a]
+        ay = y[a]
+        max_area = -1.0
+        next_a = range_start
+        for j in range(range_start, range_end):
+            area = abs((ax - avg_x) * (y[j] - ay) - (ax - x[j]) * (avg_y - ay))
+            if area > max_area:
+                max_area = area
+                next_a = j
+
+        idx[i + 1] = next_a
+        a = next_a
+
+    return idx
+
+
+@njit(cache=True)
+def _max_drift(E):
+    
+    E0 = E[0]
+    m = 0.0
+    for i in range(E.size):
+        d = abs(E[i] - E0)
+        if d > m:
+            m = d
+    return m
+
+
+def _downsample(t, y, n_out):
+    
+    if len(t) <= 4 * n_out:
+        return t, y
+    idx = _lttb(t, y, n_out)
+    return t[idx], y[idx]
 
 
 def load_json(json_path: str) -> dict:
     
+    if orjson is not None:
+        with open(json_path, "rb") as fp:
+            raw = fp.read()
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return json.loads(raw)
     with open(json_path, "r") as fp:
         return json.load(fp)
 
 
-def plot_from_json(json_path: str, output_dir: str) -> list:
+def load_plot_columns(json_path: str) -> tuple:
     
-    data = load_json(json_path)
-    meta = data["metadata"]
-    history = data["history"]
+    if ijson is None:
+        data = load_json(json_path)
+        history = data["history"]
+        cols = np.fromiter(
+            ((h["t"], h["x"], h["E"]) for h in history),
+            dtype=_COLUMN_DTYPE,
+            count=len(history),
+        )
+        return data["metadata"], cols["t"], cols["x"], cols["E"]
+
+    t = array("d")
+    x = array("d")
+    E = array("d")
+    with open(json_path, "rb") as fp:
+        meta = next(ijson.items(fp, "metadata", use_float=True))
+        fp.seek(0)
+        for h in ijson.items(fp, "history.item", use_float=True):
+            t.append(h["t"])
+            x.append(h["x"])
+            E.append(h["E"])
+    return meta, np.frombuffer(t), np.frombuffer(x), np.frombuffer(E)
 
-    solver = meta["solver"]
-    dt = meta["dt"]
-    model = meta["model"]
 
+@lru_cache(maxsize=8)
+def _load_and_prep(json_path, mtime_ns, size):
     
-    t = [h["t"] for h in history]
-    x = [h["x"] for h in history]
-    E = [h["E"] for h in history]
+    meta, t, x, E = load_plot_columns(json_path)
+    for arr in (t, x, E):
+        arr.flags.writeable = False
 
+    if HAVE_NUMBA and E.size >= KERNEL_MIN_STEPS:
+        max_drift = float(_max_drift(E))
+    else:
+        max_drift = float(np.max(np.abs(E - E[0])))
+    return meta, t, x, E, max_drift
+
+
+def _render(fig, fmt, dpi):
     
-    E0 = E[0]
-    max_drift = max(abs(e - E0) for e in E)
+    buf = io.BytesIO()
+    if fmt == "svg":
+        fig.savefig(buf, format="svg")
+        return buf.getvalue()
+    fig.savefig(buf, format="rgba", dpi=dpi)
+    width, height = (fig.get_size_inches() * dpi).round().astype(int)
+    return np.frombuffer(buf.getbuffer(), dtype=np.uint8).reshape(height, width, 4)
+
+
+def _write_image(path, image, fmt, dpi):
+    
+    if fmt == "svg":
+        with open(path, "wb") as fp:
+            fp.write(image)
+        return
+    mimage.imsave(
+        path, image, format="png", dpi=dpi,
+        pil_kwargs={"compress_level": _PNG_COMPRESS_LEVEL},
+    )
+
+
+def plot_from_json(
+    json_path: str,
+    output_dir: str,
+    downsample: bool = True,
+    dpi: int | None = None,
+    fmt: str = "png",
+) -> list:
+    
+    if fmt not in _PLOT_FORMATS:
+        raise ValueError(f"fmt must be one of {_PLOT_FORMATS}, got {fmt!r}")
+    if dpi is None:
+        dpi = 72 if os.environ.get("PLAB_FAST_PLOT") else _PLOT_DPI
+
+    st = os.stat(json_path)
+    meta, t, x, E, max_drift = _load_and_prep(
+        os.path.abspath(json_path), st.st_mtime_ns, st.st_size
+    )
+
+    solver = meta["solver"]
+    dt = meta["dt"]
+    model = meta["model"]
 
     os.makedirs(output_dir, exist_ok=True)
     prefix = f"{solver.replace(' ', '_').lower()}"
@@ -44,32 +205,45 @@ def plot_from_json(json_path: str, output_dir: str) -> list:
     subtitle = f"Solver: {solver}  |  dt = {dt}  |  Max |dE| = {max_drift:.3e}"
 
     
-    fig, ax = plt.subplots(figsize=(10, 5))
-    ax.plot(t, x, "b-", linewidth=1.2)
+    t_x, x_plot, t_E, E_plot = t, x, t, E
+    if downsample and HAVE_NUMBA:
+        n_out = int(_FIGSIZE[0] * dpi * 2)
+        t_x, x_plot = _downsample(t, x, n_out)
+        t_E, E_plot = _downsample(t, E, n_out)
+
+    
+    fig, ax = plt.subplots(figsize=_FIGSIZE)
+    line, = ax.plot(t_x, x_plot, "b-", linewidth=1.2)
     ax.set_xlabel("Time (s)")
     ax.set_ylabel("Position (m)")
     ax.set_title(f"{model} -- Position vs Time\n{subtitle}", fontsize=11)
     ax.grid(True, alpha=0.3)
-    path1 = os.path.join(output_dir, f"{prefix}_position.png")
+    path1 = os.path.join(output_dir, f"{prefix}_position.{fmt}")
+    path2 = os.path.join(output_dir, f"{prefix}_energy.{fmt}")
     fig.tight_layout()
-    fig.savefig(path1, dpi=150)
-    plt.close(fig)
-    generated.append(os.path.abspath(path1))
-    print(f"  Saved: {path1}")
 
-    
-    fig, ax = plt.subplots(figsize=(10, 5))
-    ax.plot(t, E, "r-", linewidth=1.2)
-    ax.set_xlabel("Time (s)")
-    ax.set_ylabel("Total Energy (J)")
-    ax.set_title(f"{model} -- Total Energy vs Time\n{subtitle}", fontsize=11)
-    ax.grid(True, alpha=0.3)
-    path2 = os.path.join(output_dir, f"{prefix}_energy.png")
-    fig.tight_layout()
-    fig.savefig(path2, dpi=150)
-    plt.close(fig)
-    generated.append(os.path.abspath(path2))
-    print(f"  Saved: {path2}")
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(_write_image, path1, _render(fig, fmt, dpi), fmt, dpi)
+
+        
+        line.set_data(t_E, E_plot)
+        line.set_color("r")
+        ax.relim()
+        ax.autoscale_view()
+        ax.set_ylabel("Total Energy (J)")
+        ax.set_title(f"{model} -- Total Energy vs Time\n{subtitle}", fontsize=11)
+        fig.tight_layout()
+        image2 = _render(fig, fmt, dpi)
+        plt.close(fig)
+
+        _write_image(path2, image2, fmt, dpi)
+        pending.result()
+
+    out_abs = os.path.abspath(output_dir)
+    generated.extend(
+        os.path.join(out_abs, os.path.basename(path)) for path in (path1, path2)
+    )
+    print(f"  Saved: {path1}\n  Saved: {path2}")
 
     return generated
 